@@ -0,0 +1,284 @@
+import atexit
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, Text, and_, event, inspect, select
+from sqlalchemy.ext.declarative import declarative_base
+
+# Base própria, como em auth.py, para não importar o app (importação circular)
+Base = declarative_base()
+
+
+class RegistroAuditoria(Base):
+    __tablename__ = "auditoria"
+    id_auditoria = Column(Integer, primary_key=True)
+    momento = Column(DateTime, nullable=False)
+    usuario = Column(String(150), nullable=True)
+    tabela = Column(String(100), nullable=False)
+    id_registro = Column(String(50), nullable=True)
+    operacao = Column(String(10), nullable=False)  # insert / update / delete
+    alteracoes = Column(Text, nullable=True)  # JSON {campo: [antes, depois]}
+
+
+# ---------------------------
+# Captura das alterações (eventos da sessão)
+# ---------------------------
+
+def _valor(v):
+    # Binários (PDF dos termos) não vão para o log, só o tamanho
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        return f"<{len(v)} bytes>"
+    return v
+
+
+def _sem_anterior(state):
+    # Atributo expirado (o normal depois de um commit) ou deferred que recebeu
+    # valor sem ter sido lido: o histórico não guarda o valor antigo
+    return [
+        attr for attr in state.mapper.column_attrs
+        if state.attrs[attr.key].history.added and not state.attrs[attr.key].history.deleted
+    ]
+
+
+def _ler_anteriores(session, state, attrs):
+    """Valores ainda gravados no banco (antes do flush) dos atributos dados."""
+    mapper = state.mapper
+    linha = session.connection().execute(
+        select(*[attr.columns[0] for attr in attrs]).where(
+            and_(*[col == valor for col, valor in zip(mapper.primary_key, state.identity)])
+        )
+    ).first()
+    return dict(zip([attr.key for attr in attrs], linha)) if linha else {}
+
+
+def _diff(obj, operacao, anteriores=None):
+    state = inspect(obj)
+    alteracoes = {}
+    for attr in state.mapper.column_attrs:
+        hist = state.attrs[attr.key].history
+        if operacao == "update":
+            if not hist.has_changes():
+                continue
+            if hist.deleted:
+                antes = hist.deleted[0]
+            else:
+                antes = (anteriores or {}).get(attr.key)
+            depois = hist.added[0] if hist.added else None
+            if antes == depois:
+                continue
+            alteracoes[attr.key] = [_valor(antes), _valor(depois)]
+        else:
+            valor = state.dict.get(attr.key)
+            if valor is None:
+                continue
+            if operacao == "insert":
+                alteracoes[attr.key] = [None, _valor(valor)]
+            else:
+                alteracoes[attr.key] = [_valor(valor), None]
+    return alteracoes
+
+
+def _registro(obj, operacao, usuario, anteriores=None):
+    state = inspect(obj)
+    alteracoes = _diff(obj, operacao, anteriores)
+    if operacao == "update" and not alteracoes:
+        return None
+    # Em after_flush a identity ainda não foi registrada para objetos novos
+    pk = state.mapper.primary_key_from_instance(obj)
+    return {
+        "momento": datetime.now(),
+        "usuario": usuario,
+        "tabela": state.mapper.local_table.name,
+        "id_registro": ",".join(str(v) for v in pk),
+        "operacao": operacao,
+        "alteracoes": json.dumps(alteracoes, default=str, ensure_ascii=False),
+    }
+
+
+# Ouvintes e gravador ativos por alvo. O st.cache_resource do app é refeito
+# no "Clear cache", mas os eventos ficam na classe Session global: sem este
+# registro cada reinstalação somaria ouvintes e threads.
+_instalados = {}
+
+
+def _remover_ouvintes(alvo):
+    gravador, ouvintes = _instalados.pop(alvo, (None, ()))
+    for nome, fn in ouvintes:
+        if event.contains(alvo, nome, fn):
+            event.remove(alvo, nome, fn)
+    return gravador
+
+
+def desinstalar_auditoria(alvo):
+    """Remove os eventos de auditoria de `alvo` e encerra o gravador associado."""
+    gravador = _remover_ouvintes(alvo)
+    if gravador is not None:
+        gravador.encerrar()
+
+
+def instalar_auditoria(alvo, gravador, obter_usuario, tabelas=None):
+    """Registra os eventos de auditoria em uma Session/sessionmaker.
+
+    Os diffs são montados no after_flush (quando a PK já existe e o histórico
+    dos atributos ainda está disponível) e só seguem para a fila no commit.
+    Chamar de novo para o mesmo alvo substitui a instalação anterior.
+    """
+    anterior = _remover_ouvintes(alvo)
+    if anterior is not None and anterior is not gravador:
+        anterior.encerrar()
+
+    def _auditado(obj):
+        nome = inspect(obj).mapper.local_table.name
+        if nome == RegistroAuditoria.__tablename__:
+            return False
+        return tabelas is None or nome in tabelas
+
+    def _anteriores(session, flush_context, instances):
+        # Ainda antes do flush: o banco tem o valor antigo do que não foi lido
+        anteriores = session.info.setdefault("auditoria_anteriores", {})
+        for obj in session.dirty:
+            state = inspect(obj)
+            if state.identity is None or not _auditado(obj):
+                continue
+            attrs = _sem_anterior(state)
+            if attrs:
+                anteriores[state] = _ler_anteriores(session, state, attrs)
+
+    def _capturar(session, flush_context):
+        anteriores = session.info.pop("auditoria_anteriores", {})
+        try:
+            usuario = obter_usuario()
+        except Exception:
+            usuario = None
+
+        pendentes = session.info.setdefault("auditoria_pendente", [])
+        for operacao, objs in (
+            ("insert", session.new),
+            ("update", session.dirty),
+            ("delete", session.deleted),
+        ):
+            for obj in objs:
+                if not _auditado(obj):
+                    continue
+                reg = _registro(obj, operacao, usuario, anteriores.get(inspect(obj)))
+                if reg:
+                    pendentes.append(reg)
+
+    def _publicar(session):
+        for reg in session.info.pop("auditoria_pendente", []):
+            gravador.enfileirar(reg)
+
+    def _descartar(session):
+        session.info.pop("auditoria_pendente", None)
+        session.info.pop("auditoria_anteriores", None)
+
+    ouvintes = [
+        ("before_flush", _anteriores), ("after_flush", _capturar),
+        ("after_commit", _publicar), ("after_rollback", _descartar),
+    ]
+    for nome, fn in ouvintes:
+        event.listen(alvo, nome, fn)
+    _instalados[alvo] = (gravador, ouvintes)
+
+# ---------------------------
+# Gravação em lote (write-behind)
+# ---------------------------
+
+class GravadorAuditoria:
+    """Fila limitada + thread que grava os registros em lote.
+
+    O commit da tela só paga o custo de um put_nowait. Se a fila estiver cheia
+    ou o banco falhar, os registros vão para um arquivo JSONL de reserva, que é
+    reaplicado na próxima inicialização.
+    """
+
+    def __init__(self, engine, capacidade=10000, tamanho_lote=200, intervalo=1.0,
+                 arquivo_reserva="auditoria_pendente.jsonl"):
+        self.engine = engine
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.arquivo_reserva = arquivo_reserva
+        self._fila = queue.Queue(maxsize=capacidade)
+        self._parar = threading.Event()
+        self._lock_reserva = threading.Lock()
+
+        Base.metadata.create_all(bind=engine)
+        self.reaplicar_reserva()
+
+        self._thread = threading.Thread(target=self._executar, name="auditoria", daemon=True)
+        self._thread.start()
+        atexit.register(self.encerrar)
+
+    def enfileirar(self, registro):
+        try:
+            self._fila.put_nowait(registro)
+        except queue.Full:
+            self._gravar_reserva([registro])
+
+    def _proximo_lote(self):
+        try:
+            lote = [self._fila.get(timeout=self.intervalo)]
+        except queue.Empty:
+            return []
+        while len(lote) < self.tamanho_lote:
+            try:
+                lote.append(self._fila.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _executar(self):
+        while not self._parar.is_set():
+            lote = self._proximo_lote()
+            if lote:
+                self._descarregar(lote)
+
+    def _descarregar(self, lote):
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(RegistroAuditoria.__table__.insert(), lote)
+        except Exception:
+            self._gravar_reserva(lote)
+
+    def _gravar_reserva(self, lote):
+        with self._lock_reserva:
+            with open(self.arquivo_reserva, "a", encoding="utf-8") as f:
+                for reg in lote:
+                    f.write(json.dumps(reg, default=str, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reaplicar_reserva(self):
+        if not os.path.exists(self.arquivo_reserva):
+            return 0
+        with self._lock_reserva:
+            with open(self.arquivo_reserva, encoding="utf-8") as f:
+                lote = [json.loads(linha) for linha in f if linha.strip()]
+            for reg in lote:
+                reg["momento"] = datetime.fromisoformat(reg["momento"])
+            try:
+                if lote:
+                    with self.engine.begin() as conn:
+                        conn.execute(RegistroAuditoria.__table__.insert(), lote)
+            except Exception:
+                return 0
+            os.remove(self.arquivo_reserva)
+        return len(lote)
+
+    def encerrar(self, timeout=5.0):
+        # Para a thread e esvazia o que sobrou na fila (banco ou arquivo de reserva)
+        if self._parar.is_set():
+            return
+        self._parar.set()
+        self._thread.join(timeout)
+        restante = []
+        while True:
+            try:
+                restante.append(self._fila.get_nowait())
+            except queue.Empty:
+                break
+        for i in range(0, len(restante), self.tamanho_lote):
+            self._descarregar(restante[i:i + self.tamanho_lote])
@@ -0,0 +1,63 @@
+import os
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, scoped_session
+
+# ---------------------------
+# Config / DB
+# ---------------------------
+# Importado uma vez por processo: engine e pool são compartilhados por todas
+# as sessões do Streamlit, em vez de recriados a cada rerun.
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+SessionLocal = scoped_session(sessionmaker(autoflush=False, autocommit=False))
+engine = None
+
+# Modo embarcado (DATABASE_URL=sqlite:///estagiarios.db): aplicado a cada
+# conexão nova. WAL deixa leituras concorrentes com uma escrita; o busy_timeout
+# espera o lock em vez de falhar com "database is locked".
+PRAGMAS_SQLITE = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",  # necessário para o ondelete="CASCADE" dos models
+    "busy_timeout": 5000,  # ms
+    "cache_size": -65536,  # em KiB (negativo): 64 MiB
+    "mmap_size": 268435456,  # 256 MiB
+    "temp_store": "MEMORY",
+}
+
+
+def criar_engine(url, **opcoes):
+    engine = create_engine(url, echo=False, future=True, **opcoes)
+
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine, "connect")
+        def _pragmas(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            for nome, valor in PRAGMAS_SQLITE.items():
+                cursor.execute(f"PRAGMA {nome}={valor}")
+            cursor.close()
+
+    return engine
+
+
+def configurar(url, **opcoes):
+    """(Re)cria o engine e religa o SessionLocal. `opcoes` vão para o
+    create_engine (pool_size, max_overflow, poolclass...)."""
+    global DATABASE_URL, engine
+    if engine is not None:
+        engine.dispose()
+    DATABASE_URL = url
+    engine = criar_engine(url, **opcoes)
+    SessionLocal.remove()
+    SessionLocal.configure(bind=engine)
+    return engine
+
+
+if DATABASE_URL:
+    configurar(DATABASE_URL)
+
+
+# Função para compatibilidade com o bloco de relatório obrigatório
+def session():
+    return SessionLocal()
@@ -0,0 +1,91 @@
+"""Latência adicionada por commit pela auditoria.
+
+Compara commits de UPDATE numa sessão sem auditoria e numa sessão com os
+eventos de auditoria + gravador em lote. Roda sempre num SQLite temporário,
+apagado no fim: DATABASE_URL é ignorada, para nunca tocar na tabela de
+auditoria de produção.
+
+    python benchmarks/bench_auditoria.py [n_commits]
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from banco import criar_engine
+from auditoria import GravadorAuditoria, desinstalar_auditoria, instalar_auditoria
+
+Base = declarative_base()
+
+
+class ItemBench(Base):
+    __tablename__ = "bench_auditoria_item"
+    id_item = Column(Integer, primary_key=True)
+    nome = Column(String(150))
+    status = Column(String(20))
+
+
+def medir(SessionFactory, n):
+    db = SessionFactory()
+    item = ItemBench(nome="bench", status="Ativo")
+    db.add(item)
+    db.commit()
+
+    tempos = []
+    for i in range(n):
+        item.status = "Ativo" if i % 2 else "Inativo"
+        t0 = time.perf_counter()
+        db.commit()
+        tempos.append(time.perf_counter() - t0)
+
+    db.delete(item)
+    db.commit()
+    db.close()
+    return tempos
+
+
+def resumo(nome, tempos):
+    tempos = sorted(tempos)
+    p95 = tempos[int(len(tempos) * 0.95) - 1]
+    print(f"{nome:<16} média {statistics.mean(tempos) * 1e6:9.1f} µs | "
+          f"p50 {statistics.median(tempos) * 1e6:9.1f} µs | p95 {p95 * 1e6:9.1f} µs")
+    return statistics.mean(tempos)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tmp = tempfile.mkdtemp()
+    engine = criar_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+    Base.metadata.create_all(bind=engine)
+
+    SemAuditoria = sessionmaker(bind=engine)
+    ComAuditoria = sessionmaker(bind=engine)
+    gravador = GravadorAuditoria(engine, arquivo_reserva=os.path.join(tmp, "reserva.jsonl"))
+    instalar_auditoria(ComAuditoria, gravador, lambda: "bench", tabelas={ItemBench.__tablename__})
+
+    # aquecimento
+    medir(SemAuditoria, 50)
+    medir(ComAuditoria, 50)
+
+    base = resumo("sem auditoria", medir(SemAuditoria, n))
+    com = resumo("com auditoria", medir(ComAuditoria, n))
+    print(f"latência adicionada por commit: {(com - base) * 1e6:.1f} µs")
+
+    t0 = time.perf_counter()
+    desinstalar_auditoria(ComAuditoria)
+    print(f"descarga final da fila: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    engine.dispose()
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
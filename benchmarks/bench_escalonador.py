@@ -0,0 +1,50 @@
+"""Tempo do escalonador de férias com milhares de estagiários sintéticos.
+
+    python benchmarks/bench_escalonador.py [n_estagiarios] [n_lotacoes]
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from escalonador import escalonar
+
+
+def gerar(n, n_lotacoes, hoje):
+    rnd = random.Random(42)
+    pendencias, ferias = [], []
+    for i in range(n):
+        lotacao = f"Setor {i % n_lotacoes}"
+        termino = hoje + timedelta(days=rnd.randint(30, 365))
+        pendencias.append({
+            "id_estagiario": i, "nome": f"Estagiário {i}", "lotacao": lotacao,
+            "inicio": hoje - timedelta(days=rnd.randint(0, 300)),
+            "termino": termino, "saldo": rnd.randint(5, 30),
+        })
+        if rnd.random() < 0.2:
+            ini = hoje + timedelta(days=rnd.randint(0, 60))
+            ferias.append((i, lotacao, ini, ini + timedelta(days=rnd.randint(4, 14))))
+    return pendencias, ferias
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    n_lotacoes = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    hoje = date.today()
+    pendencias, ferias = gerar(n, n_lotacoes, hoje)
+    limite = max(1, n // n_lotacoes // 5)
+
+    escalonar(pendencias[:50], ferias, limite_padrao=limite, hoje=hoje)  # aquecimento (calendários)
+
+    t0 = time.perf_counter()
+    propostas, sem_janela = escalonar(pendencias, ferias, limite_padrao=limite, hoje=hoje)
+    dt = time.perf_counter() - t0
+    print(f"{n} estagiários, {n_lotacoes} lotações, limite {limite}/dia: "
+          f"{len(propostas)} propostas, {len(sem_janela)} sem janela em {dt * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Tempo de cold start e de rerun por página, via streamlit AppTest.
+
+Mede o script de entrada informado (padrão: estagiario_app.py deste
+diretório). Para comparar com a versão anterior à navegação multipágina:
+
+    git worktree add /tmp/antes <commit>
+    python benchmarks/bench_navegacao.py /tmp/antes/estagiario_app.py
+    python benchmarks/bench_navegacao.py
+
+Roda sempre num SQLite temporário populado com dados de exemplo; a
+DATABASE_URL do ambiente é ignorada. Outro banco só com --url explícita:
+os estagiários de exemplo são inseridos nele (se estiver vazio) e apagados
+ao final.
+
+    python benchmarks/bench_navegacao.py --url postgresql+psycopg2://.../bench
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+PAGINAS = {
+    "Dashboard": "paginas/dashboard.py",
+    "Estagiários": "paginas/estagiarios.py",
+    "Contratos": "paginas/contratos.py",
+    "Férias": "paginas/ferias.py",
+    "Cálculo de Férias": "paginas/calculo_ferias.py",
+    "Termos de Compromisso": "paginas/termos.py",
+}
+
+# Executado num interpretador novo: mede a primeira execução completa do app
+COLD_START = """
+import sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.session_state["autenticado"] = True
+at.session_state["usuario_nome"] = "bench"
+t0 = time.perf_counter()
+at.run()
+print(time.perf_counter() - t0)
+"""
+
+
+def popular(url, n=300):
+    from sqlalchemy.orm import Session
+    from banco import criar_engine
+    from models import Base, Estagiario, Contrato, Ferias
+
+    engine = criar_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as s:
+        if s.query(Estagiario).count():
+            engine.dispose()
+            return []
+        hoje = date.today()
+        for i in range(n):
+            e = Estagiario(nome=f"Estagiário {i:04d}", curso="Direito", lotacao=f"Setor {i % 12}",
+                           turno="Manhã", status="Ativo")
+            inicio = hoje - timedelta(days=30 * (i % 20))
+            e.contratos.append(Contrato(data_inicio=inicio, data_termino=inicio + timedelta(days=180),
+                                        status="Ativo", tipo_contrato="inicial"))
+            e.ferias.append(Ferias(periodo_inicio=inicio + timedelta(days=60),
+                                   periodo_fim=inicio + timedelta(days=69), dias_usufruidos="10"))
+            s.add(e)
+        s.commit()
+        ids = [i for (i,) in s.query(Estagiario.id_estagiario)]
+    engine.dispose()
+    return ids
+
+
+def limpar(url, ids):
+    """Apaga os estagiários criados por popular() (contratos, férias e resumo
+    vão junto pelo ON DELETE CASCADE). Core, sem passar pelos eventos da sessão."""
+    from sqlalchemy import delete
+    from banco import criar_engine
+    from models import Estagiario
+
+    if not ids:
+        return
+    engine = criar_engine(url)
+    with engine.begin() as conn:
+        for i in range(0, len(ids), 500):
+            conn.execute(delete(Estagiario).where(Estagiario.id_estagiario.in_(ids[i:i + 500])))
+    engine.dispose()
+
+
+def isolar(entrada):
+    """Faz o AppTest importar os módulos da árvore da entrada, não desta.
+
+    popular() já carregou banco/models daqui; sem isso a versão de outro
+    worktree rodaria com os módulos atuais e a comparação não valeria nada.
+    """
+    pasta = os.path.dirname(entrada)
+    if pasta == RAIZ:
+        return
+    sys.path[:] = [pasta] + [p for p in sys.path if os.path.abspath(p or ".") != RAIZ]
+    for nome, modulo in list(sys.modules.items()):
+        arquivo = getattr(modulo, "__file__", None)
+        if nome != "__main__" and arquivo and os.path.dirname(os.path.abspath(arquivo)) == RAIZ:
+            del sys.modules[nome]
+
+
+def abrir(at, nome, multipagina):
+    if multipagina:
+        at.switch_page(PAGINAS[nome])
+    else:
+        at.session_state["menu"] = nome
+    at.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("entrada", nargs="?", default=os.path.join(RAIZ, "estagiario_app.py"))
+    parser.add_argument("repeticoes", nargs="?", type=int, default=20)
+    parser.add_argument("--url", help="banco alvo (padrão: SQLite temporário); DATABASE_URL não é usada")
+    args = parser.parse_args()
+
+    entrada = os.path.abspath(args.entrada)
+    tmp = None if args.url else tempfile.mkdtemp()
+    url = args.url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+    # O app (e o cold start, em outro processo) leem o banco daqui
+    os.environ["DATABASE_URL"] = url
+    semeados = popular(url)
+    try:
+        medir(entrada, args.repeticoes)
+    finally:
+        limpar(url, semeados)
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def medir(entrada, repeticoes):
+    from streamlit.testing.v1 import AppTest
+
+    multipagina = "st.navigation" in open(entrada, encoding="utf-8").read()
+    print(f"entrada: {entrada} ({'multipágina' if multipagina else 'script único'})")
+
+    frios = []
+    for _ in range(3):
+        saida = subprocess.run([sys.executable, "-c", COLD_START, entrada],
+                               capture_output=True, text=True, check=True, cwd=os.path.dirname(entrada))
+        frios.append(float(saida.stdout.strip().splitlines()[-1]))
+    print(f"cold start (primeira execução): {statistics.median(frios) * 1e3:8.1f} ms")
+
+    isolar(entrada)
+    at = AppTest.from_file(entrada, default_timeout=120)
+    at.session_state["autenticado"] = True
+    at.session_state["usuario_nome"] = "bench"
+    at.run()
+
+    for nome in PAGINAS:
+        abrir(at, nome, multipagina)
+        tempos = []
+        for _ in range(repeticoes):
+            t0 = time.perf_counter()
+            at.run()
+            tempos.append(time.perf_counter() - t0)
+        print(f"rerun {nome:<24} p50 {statistics.median(tempos) * 1e3:8.1f} ms | "
+              f"máx {max(tempos) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""Teste de carga: N sessões simultâneas contra o pool de conexões.
+
+Cada sessão é um AppTest numa thread: faz login pelo formulário e percorre
+várias vezes todas as páginas registradas no st.navigation do script de
+entrada (a Busca com um termo preenchido). Ao final mostra a latência de rerun
+(p50/p95/p99), a espera por conexão no pool, os timeouts de checkout e as
+conexões que ficaram presas (vazadas).
+
+    python benchmarks/teste_carga.py --sessoes 20 --ciclos 5 --pool-size 5 --max-overflow 10
+
+Roda num SQLite temporário com dados de exemplo; DATABASE_URL é ignorada.
+Outro banco só com --url explícita: o administrador de teste (senha aleatória)
+e os estagiários de exemplo são apagados no fim, mesmo se o teste falhar.
+"""
+import argparse
+import os
+import re
+import secrets
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+import banco
+from bench_navegacao import limpar, popular
+
+EMAIL = "carga@teste.local"
+SENHA = secrets.token_urlsafe(16)
+TERMO_BUSCA = "Direito"
+
+
+class PoolMedido(QueuePool):
+    """QueuePool que mede quanto cada checkout esperou por uma conexão.
+
+    Com overflow o _do_get também abre conexões novas; esse tempo é medido à
+    parte (conexoes) e descontado da espera, que fica só com o bloqueio.
+    """
+
+    esperas = []
+    conexoes = []
+    timeouts = 0
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    def _create_connection(self):
+        t0 = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            duracao = time.perf_counter() - t0
+            PoolMedido._local.criacao = getattr(PoolMedido._local, "criacao", 0.0) + duracao
+            with PoolMedido._lock:
+                PoolMedido.conexoes.append(duracao)
+
+    # _do_get é o ponto em que o QueuePool bloqueia esperando conexão livre
+    def _do_get(self):
+        PoolMedido._local.criacao = 0.0
+        t0 = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with PoolMedido._lock:
+                PoolMedido.timeouts += 1
+            raise
+        finally:
+            espera = time.perf_counter() - t0 - PoolMedido._local.criacao
+            with PoolMedido._lock:
+                PoolMedido.esperas.append(espera)
+
+
+def criar_admin(engine):
+    from passlib.hash import pbkdf2_sha256
+    from sqlalchemy.orm import Session
+    from models import Administrador
+
+    with Session(engine) as s:
+        if s.query(Administrador).filter(Administrador.email == EMAIL).first():
+            raise SystemExit(f"Já existe um administrador {EMAIL}; remova-o antes do teste de carga.")
+        s.add(Administrador(nome="Teste de Carga", email=EMAIL,
+                            senha_hash=pbkdf2_sha256.hash(SENHA)))
+        s.commit()
+
+
+def remover_admin(engine):
+    from sqlalchemy import delete
+    from models import Administrador
+
+    with engine.begin() as conn:
+        conn.execute(delete(Administrador).where(Administrador.email == EMAIL))
+
+
+def paginas_da_entrada(entrada):
+    """Caminhos dos st.Page(...) do script de entrada, na ordem do menu."""
+    with open(entrada, encoding="utf-8") as f:
+        return re.findall(r'st\.Page\(\s*"([^"]+)"', f.read())
+
+
+def runtime_compartilhado():
+    """Estado global do AppTest fixo para todas as sessões do processo.
+
+    A cada run() o AppTest troca Runtime._instance (e zera no fim), liga o
+    modo de teste com um patch em config.get_option e cria um ScriptCache
+    novo. Com várias sessões em threads, uma desfazia o runtime ou o modo de
+    teste da outra no meio da execução ("Runtime hasn't been created!",
+    KeyError em selectbox, run travado até o timeout), e as páginas eram
+    recompiladas em paralelo, o que dispara um bug do ast.parse com threads
+    no CPython 3.11. Aqui os três são montados uma vez, como no servidor do
+    Streamlit, e o AppTest passa a usar os mesmos.
+    """
+    from contextlib import nullcontext
+    from unittest.mock import MagicMock
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    app_test.Runtime = type("RuntimePorRun", (), {"_instance": None})
+
+    cache = ScriptCache()
+    app_test.ScriptCache = lambda: cache
+
+    config.set_option("global.appTest", True)
+    app_test.patch_config_options = lambda _opcoes: nullcontext()
+
+
+def simular_sessao(entrada, paginas, ciclos):
+    from streamlit.testing.v1 import AppTest
+
+    latencias, erros = [], 0
+    at = AppTest.from_file(entrada, default_timeout=120)
+    at.run()
+    at.text_input[0].input(EMAIL)
+    at.text_input[1].input(SENHA)
+    at.button[0].click()
+
+    t0 = time.perf_counter()
+    at.run()
+    latencias.append(time.perf_counter() - t0)
+    if not at.session_state["autenticado"]:
+        return latencias, 1
+
+    # Sem termo a página de Busca só mostra um aviso; com ele, consulta o índice
+    at.session_state["busca_global"] = TERMO_BUSCA
+
+    for _ in range(ciclos):
+        for caminho in paginas:
+            at.switch_page(caminho)
+            t0 = time.perf_counter()
+            at.run()
+            latencias.append(time.perf_counter() - t0)
+            erros += len(at.exception)
+    return latencias, erros
+
+
+def percentis(valores):
+    if len(valores) < 2:
+        return [valores[0] if valores else 0.0] * 3
+    q = statistics.quantiles(valores, n=100)
+    return q[49], q[94], q[98]
+
+
+def executar(args, paginas, engine):
+    print(f"{len(paginas)} páginas, {args.sessoes} sessões x {args.ciclos} ciclos, pool_size={args.pool_size} "
+          f"max_overflow={args.max_overflow} pool_timeout={args.pool_timeout}s")
+
+    runtime_compartilhado()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.sessoes) as executor:
+        resultados = list(executor.map(
+            lambda _: simular_sessao(args.entrada, paginas, args.ciclos), range(args.sessoes)
+        ))
+    total = time.perf_counter() - t0
+
+    latencias = [t for lat, _ in resultados for t in lat]
+    erros = sum(e for _, e in resultados)
+    p50, p95, p99 = percentis(latencias)
+    e50, e95, e99 = percentis(PoolMedido.esperas)
+    c50, c95, c99 = percentis(PoolMedido.conexoes)
+
+    print(f"reruns: {len(latencias)} em {total:.1f} s ({len(latencias) / total:.1f}/s), erros: {erros}")
+    print(f"latência de rerun   p50 {p50 * 1e3:8.1f} ms | p95 {p95 * 1e3:8.1f} ms | p99 {p99 * 1e3:8.1f} ms")
+    print(f"espera no pool      p50 {e50 * 1e3:8.1f} ms | p95 {e95 * 1e3:8.1f} ms | p99 {e99 * 1e3:8.1f} ms "
+          f"({len(PoolMedido.esperas)} checkouts)")
+    print(f"criação de conexão  p50 {c50 * 1e3:8.1f} ms | p95 {c95 * 1e3:8.1f} ms | p99 {c99 * 1e3:8.1f} ms "
+          f"({len(PoolMedido.conexoes)} conexões abertas)")
+    print(f"timeouts de checkout: {PoolMedido.timeouts}")
+    print(f"conexões vazadas (ainda em uso ao final): {engine.pool.checkedout()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessoes", type=int, default=10)
+    parser.add_argument("--ciclos", type=int, default=3)
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=10)
+    parser.add_argument("--pool-timeout", type=float, default=30)
+    parser.add_argument("--entrada", default=os.path.join(RAIZ, "estagiario_app.py"))
+    parser.add_argument("--url", help="banco alvo (padrão: SQLite temporário); DATABASE_URL não é usada")
+    args = parser.parse_args()
+
+    paginas = paginas_da_entrada(args.entrada)
+    if not paginas:
+        parser.error(f"{args.entrada} não registra páginas com st.Page")
+
+    tmp = None if args.url else tempfile.mkdtemp()
+    url = args.url or f"sqlite:///{os.path.join(tmp, 'carga.db')}"
+    os.environ["DATABASE_URL"] = url
+    semeados = popular(url)
+
+    engine = banco.configurar(
+        url,
+        poolclass=PoolMedido,
+        pool_size=args.pool_size,
+        max_overflow=args.max_overflow,
+        pool_timeout=args.pool_timeout,
+    )
+    try:
+        criar_admin(engine)
+        try:
+            executar(args, paginas, engine)
+        finally:
+            remover_admin(engine)
+    finally:
+        engine.dispose()
+        limpar(url, semeados)
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Busca textual em estagiários, contratos (obs, substituindo) e férias (memorando).
+
+PostgreSQL: índices GIN sobre expressões to_tsvector; como o índice é da
+própria expressão, o banco o mantém a cada escrita, sem triggers.
+SQLite: tabela FTS5 busca_fts mantida por triggers nas três tabelas.
+
+Nos dois casos a busca é uma única consulta indexada, ordenada por
+relevância, com trecho destacado e paginação, e se comporta igual: ignora
+acentos e casa cada palavra digitada como prefixo.
+"""
+import re
+
+from sqlalchemy import text
+
+POR_PAGINA = 20
+PALAVRAS_TRECHO = 16
+
+# ---------------------------
+# PostgreSQL
+# ---------------------------
+
+# Sem acento via translate() (nativa e IMMUTABLE, pode ir no índice) em vez da
+# extensão unaccent, que nem todo banco tem nem todo usuário pode criar.
+# As duas strings têm o mesmo tamanho: o texto sem acento tem as mesmas
+# posições do original, o que _trecho_pg usa para recolocar os acentos.
+_COM_ACENTO = "ÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇÑáàâãäéèêëíìîïóòôõöúùûüçñ"
+_SEM_ACENTO = "AAAAAEEEEIIIIOOOOOUUUUCNaaaaaeeeeiiiiooooouuuucn"
+_TIRAR_ACENTOS = str.maketrans(_COM_ACENTO, _SEM_ACENTO)
+
+# Delimitadores do destaque no ts_headline: caracteres que não aparecem no texto
+_INICIO, _FIM = "\x02", "\x03"
+
+# Texto indexado por tabela. O WHERE da busca usa exatamente estas expressões,
+# senão o planejador não usa os índices.
+_DOCS_PG = {
+    "estagiarios": "coalesce(nome, '') || ' ' || coalesce(curso, '') || ' ' || "
+                   "coalesce(lotacao, '') || ' ' || coalesce(supervisor, '')",
+    "contrato": "coalesce(substituindo, '') || ' ' || coalesce(obs, '')",
+    "ferias": "coalesce(memorando, '')",
+}
+
+
+def _sem_acento_pg(expr):
+    return f"translate({expr}, '{_COM_ACENTO}', '{_SEM_ACENTO}')"
+
+
+def _doc_pg(tabela, alias=None):
+    doc = _DOCS_PG[tabela]
+    return doc.replace("coalesce(", f"coalesce({alias}.") if alias else doc
+
+
+def _vetor_pg(tabela, alias=None):
+    return f"to_tsvector('portuguese', {_sem_acento_pg(_doc_pg(tabela, alias))})"
+
+
+def _instalar_pg(conn):
+    for tabela in _DOCS_PG:
+        # Índices da versão sem tratamento de acentos: a busca não os usa mais
+        conn.execute(text(f"DROP INDEX IF EXISTS ix_busca_{tabela}"))
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ix_busca_sem_acento_{tabela} ON {tabela} "
+            f"USING GIN (({_vetor_pg(tabela)}))"
+        ))
+
+
+_BUSCA_PG = f"""
+WITH q AS (SELECT to_tsquery('portuguese', :termo) AS q),
+hits AS (
+    SELECT 'estagiario' AS tipo, e.id_estagiario AS ref_id, e.id_estagiario,
+           {_doc_pg('estagiarios', 'e')} AS doc,
+           ts_rank({_vetor_pg('estagiarios', 'e')}, q.q) AS rank
+    FROM estagiarios e, q
+    WHERE {_vetor_pg('estagiarios', 'e')} @@ q.q
+    UNION ALL
+    SELECT 'contrato', c.id_contrato, c.id_estagiario,
+           {_doc_pg('contrato', 'c')},
+           ts_rank({_vetor_pg('contrato', 'c')}, q.q)
+    FROM contrato c, q
+    WHERE {_vetor_pg('contrato', 'c')} @@ q.q
+    UNION ALL
+    SELECT 'ferias', f.id_ferias, f.id_estagiario,
+           {_doc_pg('ferias', 'f')},
+           ts_rank({_vetor_pg('ferias', 'f')}, q.q)
+    FROM ferias f, q
+    WHERE {_vetor_pg('ferias', 'f')} @@ q.q
+),
+pagina AS (
+    SELECT h.*, count(*) OVER () AS total
+    FROM hits h
+    ORDER BY rank DESC, tipo, ref_id
+    LIMIT :limite OFFSET :offset
+)
+SELECT p.tipo, p.ref_id, e.nome AS titulo, p.doc,
+       ts_headline('portuguese', {_sem_acento_pg('p.doc')}, q.q,
+                   'StartSel={_INICIO}, StopSel={_FIM}, HighlightAll=true') AS trecho,
+       p.rank, p.total
+FROM pagina p
+JOIN estagiarios e ON e.id_estagiario = p.id_estagiario, q
+ORDER BY p.rank DESC, p.tipo, p.ref_id
+"""
+
+
+def _consulta_tsquery(termo):
+    # Mesma regra do FTS5: só as palavras, sem acento, cada uma como prefixo.
+    # Nada do que o usuário digitar é interpretado como sintaxe do tsquery.
+    palavras = re.findall(r"\w+", termo.translate(_TIRAR_ACENTOS))
+    return " & ".join(f"{p}:*" for p in palavras)
+
+
+def _trecho_pg(doc, marcado, palavras=PALAVRAS_TRECHO):
+    """Trecho no formato do snippet() do SQLite, a partir do ts_headline.
+
+    O destaque é feito sobre o texto sem acento; como translate() preserva as
+    posições, os caracteres vêm do documento original. Depois recorta até
+    `palavras` palavras em volta do primeiro termo destacado."""
+    partes, i = [], 0
+    for ch in marcado:
+        if ch in (_INICIO, _FIM):
+            partes.append("**")
+        else:
+            partes.append(doc[i])
+            i += 1
+    texto = "".join(partes).split()
+
+    primeiro = next((n for n, p in enumerate(texto) if "**" in p), 0)
+    inicio = max(0, min(primeiro - palavras // 4, len(texto) - palavras))
+    fim = inicio + palavras
+    return ("…" if inicio > 0 else "") + " ".join(texto[inicio:fim]) + ("…" if fim < len(texto) else "")
+
+
+# ---------------------------
+# SQLite (FTS5)
+# ---------------------------
+
+# rowid = id * 4 + código do tipo: atualizar/apagar pelo rowid é O(log n)
+_FONTES_SQLITE = {
+    "estagiarios": ("estagiario", 1, "id_estagiario",
+                    "coalesce({r}.nome, '') || ' ' || coalesce({r}.curso, '') || ' ' || "
+                    "coalesce({r}.lotacao, '') || ' ' || coalesce({r}.supervisor, '')"),
+    "contrato": ("contrato", 2, "id_contrato",
+                 "coalesce({r}.substituindo, '') || ' ' || coalesce({r}.obs, '')"),
+    "ferias": ("ferias", 3, "id_ferias", "coalesce({r}.memorando, '')"),
+}
+
+
+def _instalar_sqlite(conn):
+    conn.execute(text(
+        "CREATE VIRTUAL TABLE IF NOT EXISTS busca_fts USING fts5("
+        "tipo UNINDEXED, ref_id UNINDEXED, id_estagiario UNINDEXED, texto, "
+        "tokenize = 'unicode61 remove_diacritics 2')"
+    ))
+
+    for tabela, (tipo, codigo, pk, doc) in _FONTES_SQLITE.items():
+        inserir = (
+            f"INSERT INTO busca_fts(rowid, tipo, ref_id, id_estagiario, texto) "
+            f"VALUES (NEW.{pk} * 4 + {codigo}, '{tipo}', NEW.{pk}, NEW.id_estagiario, "
+            f"{doc.format(r='NEW')});"
+        )
+        apagar = f"DELETE FROM busca_fts WHERE rowid = OLD.{pk} * 4 + {codigo};"
+        conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS busca_{tabela}_ai AFTER INSERT ON {tabela} BEGIN {inserir} END"))
+        conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS busca_{tabela}_ad AFTER DELETE ON {tabela} BEGIN {apagar} END"))
+        conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS busca_{tabela}_au AFTER UPDATE ON {tabela} BEGIN {apagar} {inserir} END"))
+
+    # Primeira instalação sobre um banco já com dados
+    if conn.execute(text("SELECT count(*) FROM busca_fts")).scalar() == 0:
+        for tabela, (tipo, codigo, pk, doc) in _FONTES_SQLITE.items():
+            conn.execute(text(
+                f"INSERT INTO busca_fts(rowid, tipo, ref_id, id_estagiario, texto) "
+                f"SELECT t.{pk} * 4 + {codigo}, '{tipo}', t.{pk}, t.id_estagiario, "
+                f"{doc.format(r='t')} FROM {tabela} t"
+            ))
+
+
+# bm25()/snippet() não podem aparecer junto com funções de janela no mesmo
+# SELECT do FTS5: ficam na subconsulta do MATCH; join, total e paginação, fora.
+_BUSCA_SQLITE = f"""
+SELECT h.tipo, h.ref_id, e.nome AS titulo, h.trecho, h.rank,
+       count(*) OVER () AS total
+FROM (
+    SELECT tipo, ref_id, id_estagiario,
+           snippet(busca_fts, 3, '**', '**', '…', {PALAVRAS_TRECHO}) AS trecho,
+           -bm25(busca_fts) AS rank
+    FROM busca_fts
+    WHERE busca_fts MATCH :termo
+) h
+JOIN estagiarios e ON e.id_estagiario = h.id_estagiario
+ORDER BY h.rank DESC, h.tipo, h.ref_id
+LIMIT :limite OFFSET :offset
+"""
+
+
+def _consulta_fts5(termo):
+    # Cada palavra vira um prefixo entre aspas: nada do que o usuário digitar
+    # é interpretado como sintaxe do FTS5
+    return " ".join(f'"{p}"*' for p in re.findall(r"\w+", termo))
+
+
+# ---------------------------
+# API
+# ---------------------------
+
+def instalar_busca(engine):
+    """Cria os índices/triggers da busca. Retorna False se o banco não tem
+    busca textual suportada: quem chama esconde a busca da interface."""
+    instaladores = {"postgresql": _instalar_pg, "sqlite": _instalar_sqlite}
+    instalar = instaladores.get(engine.dialect.name)
+    if instalar is None:
+        return False
+    with engine.begin() as conn:
+        instalar(conn)
+    return True
+
+
+def buscar(conn, termo, pagina=1, por_pagina=POR_PAGINA):
+    """Retorna (resultados, total). Cada resultado é um dict com tipo
+    ('estagiario', 'contrato', 'ferias'), ref_id, titulo, trecho e rank.
+    Só deve ser chamada se instalar_busca retornou True."""
+    termo = (termo or "").strip()
+    postgres = conn.dialect.name == "postgresql"
+    termo = _consulta_tsquery(termo) if postgres else _consulta_fts5(termo)
+    if not termo:
+        return [], 0
+
+    linhas = conn.execute(text(_BUSCA_PG if postgres else _BUSCA_SQLITE), {
+        "termo": termo,
+        "limite": por_pagina,
+        "offset": (max(pagina, 1) - 1) * por_pagina,
+    }).mappings().all()
+    total = linhas[0]["total"] if linhas else 0
+
+    resultados = []
+    for linha in linhas:
+        r = dict(linha)
+        if postgres:
+            r["trecho"] = _trecho_pg(r.pop("doc"), r["trecho"])
+        resultados.append(r)
+    return resultados, total
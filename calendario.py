@@ -0,0 +1,86 @@
+"""Calendário de dias úteis com feriados, sobre numpy.busday_*.
+
+Os feriados vêm de feriados/<ano>.csv (colunas data, descricao, lotacao);
+lotação vazia vale para todas. Cada lotação tem um np.busdaycalendar próprio,
+montado uma vez por processo. As funções *_lote recebem arrays e fazem uma
+chamada vetorizada por lotação, sem laço por linha.
+"""
+import csv
+import glob
+import os
+from datetime import timedelta
+from functools import lru_cache
+
+import numpy as np
+
+PASTA_FERIADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "feriados")
+
+
+@lru_cache(maxsize=1)
+def _feriados_por_lotacao():
+    feriados = {}
+    for caminho in sorted(glob.glob(os.path.join(PASTA_FERIADOS, "*.csv"))):
+        with open(caminho, encoding="utf-8") as f:
+            for linha in csv.DictReader(f):
+                lotacao = (linha.get("lotacao") or "").strip()
+                feriados.setdefault(lotacao, []).append(linha["data"].strip())
+    return feriados
+
+
+@lru_cache(maxsize=None)
+def calendario(lotacao=None):
+    feriados = _feriados_por_lotacao()
+    datas = feriados.get("", []) + (feriados.get(lotacao.strip(), []) if lotacao else [])
+    return np.busdaycalendar(holidays=np.array(datas, dtype="datetime64[D]"))
+
+
+def _d(valor):
+    return np.asarray(valor, dtype="datetime64[D]")
+
+
+# ---------------------------
+# Um pedido
+# ---------------------------
+
+def dias_uteis(inicio, fim, lotacao=None):
+    """Dias úteis entre inicio e fim, inclusive os dois."""
+    return int(np.busday_count(_d(inicio), _d(fim + timedelta(days=1)), busdaycal=calendario(lotacao)))
+
+
+def data_retorno(fim, lotacao=None):
+    """Primeiro dia útil depois do fim das férias."""
+    return np.busday_offset(_d(fim + timedelta(days=1)), 0, roll="forward",
+                            busdaycal=calendario(lotacao)).item()
+
+
+def proximo_dia_util(dia, lotacao=None):
+    return np.busday_offset(_d(dia), 0, roll="forward", busdaycal=calendario(lotacao)).item()
+
+
+# ---------------------------
+# Lotes (relatórios)
+# ---------------------------
+
+def _por_lotacao(lotacoes):
+    if lotacoes is None:
+        return {None: slice(None)}
+    lotacoes = np.asarray([l or "" for l in lotacoes], dtype=object)
+    return {l or None: np.flatnonzero(lotacoes == l) for l in np.unique(lotacoes)}
+
+
+def dias_uteis_lote(inicios, fins, lotacoes=None):
+    inicios, fins = _d(inicios), _d(fins)
+    resultado = np.zeros(len(inicios), dtype="int64")
+    for lotacao, idx in _por_lotacao(lotacoes).items():
+        resultado[idx] = np.busday_count(inicios[idx], fins[idx] + np.timedelta64(1, "D"),
+                                         busdaycal=calendario(lotacao))
+    return resultado
+
+
+def datas_retorno_lote(fins, lotacoes=None):
+    fins = _d(fins)
+    resultado = np.empty(len(fins), dtype="datetime64[D]")
+    for lotacao, idx in _por_lotacao(lotacoes).items():
+        resultado[idx] = np.busday_offset(fins[idx] + np.timedelta64(1, "D"), 0, roll="forward",
+                                          busdaycal=calendario(lotacao))
+    return resultado
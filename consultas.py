@@ -0,0 +1,98 @@
+import re
+import streamlit as st
+from sqlalchemy.orm import Session
+
+import banco
+from models import Estagiario, Contrato, Ferias, TermoCompromisso
+from versoes import versao
+
+# ---------------------------
+# Funções auxiliares compartilhadas pelas páginas
+# ---------------------------
+# Sem pandas aqui: as páginas que precisam dele importam sob demanda.
+
+def dias_usufruidos_total(db_session, id_estagiario: int) -> float:
+    ferias_list = db_session.query(Ferias).filter(Ferias.id_estagiario == id_estagiario).all()
+    soma = 0.0
+    for f in ferias_list:
+        if f.dias_usufruidos:
+            m = re.search(r"(\d+)", str(f.dias_usufruidos))
+            if m:
+                soma += float(m.group(1))
+    return soma
+
+
+def tabela(query, datas=()):
+    """DataFrame direto do cursor para as colunas projetadas da query.
+
+    Não cria objetos ORM nem dispara lazy loads por linha; as colunas em
+    `datas` chegam como datetime64, prontas para formatação vetorizada.
+    """
+    import pandas as pd
+    return pd.read_sql(query.statement, query.session.connection(), parse_dates=list(datas))
+
+
+# Listas dos seletores: cache do processo (compartilhado entre sessões),
+# chaveado pela versão da tabela, que muda a cada commit que a altera
+# (sem "_" no nome do argumento, senão o st.cache_data não o usa na chave).
+@st.cache_data(ttl=3600, show_spinner=False)
+def _lista_estagiarios(versao_tabela):
+    with Session(banco.engine) as s:
+        return [
+            (id_est, nome)
+            for id_est, nome in s.query(Estagiario.id_estagiario, Estagiario.nome)
+            .order_by(Estagiario.nome)
+        ]
+
+
+def lista_estagiarios():
+    return _lista_estagiarios(versao("estagiarios"))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _lista_contratos(id_estagiario, versao_tabela):
+    with Session(banco.engine) as s:
+        return [
+            (id_c, ini, fim)
+            for id_c, ini, fim in s.query(
+                Contrato.id_contrato, Contrato.data_inicio, Contrato.data_termino
+            )
+            .filter(Contrato.id_estagiario == id_estagiario)
+            .order_by(Contrato.data_inicio)
+        ]
+
+
+def lista_contratos(id_estagiario):
+    return _lista_contratos(id_estagiario, versao("contrato"))
+
+
+def arquivo_termo(id_termo):
+    """Conteúdo do termo (coluna adiada no model). Usada como `data` do
+    st.download_button: o Streamlit só a chama no clique, fora do rerun,
+    por isso abre a própria sessão."""
+    with Session(banco.engine) as s:
+        return s.query(TermoCompromisso.arquivo).filter(
+            TermoCompromisso.id_termo == id_termo
+        ).scalar()
+
+
+# Série mensal do relatório: meses fechados ficam em cache no processo
+@st.cache_resource
+def cache_serie_mensal():
+    from relatorios import CacheSerieMensal
+    return CacheSerieMensal()
+
+
+def carregar_contratos_relatorio(desde=None):
+    import pandas as pd
+    from relatorios import COLUNAS_CONTRATOS
+
+    with Session(banco.engine) as s:
+        q = s.query(
+            Contrato.id_contrato, Contrato.id_estagiario,
+            Contrato.data_inicio, Contrato.data_termino, Contrato.tipo_contrato,
+            Estagiario.lotacao, Estagiario.curso
+        ).join(Estagiario)
+        if desde is not None:
+            q = q.filter(Contrato.data_termino >= desde)
+        return pd.DataFrame(q.all(), columns=COLUNAS_CONTRATOS)
@@ -0,0 +1,143 @@
+"""Escala de férias em lote: propõe, para todos os contratos ativos com saldo,
+uma janela de férias antes do término do contrato.
+
+Guloso por prazo (heap pelo término do contrato, maior saldo primeiro no
+empate). Para cada estagiário procura a primeira janela de `saldo` dias
+corridos que começa num dia útil da sua lotação, não cruza férias já
+registradas dele e não passa do limite de estagiários de férias ao mesmo
+tempo na lotação. A ocupação por lotação é um array por dia do horizonte e a
+busca da janela é vetorizada (soma acumulada), então milhares de
+estagiários são escalados em menos de um segundo.
+"""
+import heapq
+from datetime import date
+
+import numpy as np
+from sqlalchemy import select
+
+from calendario import calendario
+from models import Estagiario, Ferias, EstagiarioResumo
+from resumo import dias_adquiridos
+
+
+def carregar_pendencias(conn, hoje=None, termino_ate=None):
+    """Contratos atuais (estagiário ativo) com saldo de férias projetado até o término."""
+    hoje = hoje or date.today()
+    q = (
+        select(
+            Estagiario.id_estagiario, Estagiario.nome, Estagiario.lotacao,
+            EstagiarioResumo.inicio_contrato_atual, EstagiarioResumo.termino_contrato_atual,
+            EstagiarioResumo.primeiro_inicio, EstagiarioResumo.ultimo_termino,
+            EstagiarioResumo.dias_usufruidos
+        )
+        .join(EstagiarioResumo, EstagiarioResumo.id_estagiario == Estagiario.id_estagiario)
+        .where(
+            Estagiario.status == "Ativo",
+            EstagiarioResumo.id_contrato_atual.is_not(None),
+            EstagiarioResumo.termino_contrato_atual >= hoje
+        )
+    )
+    if termino_ate is not None:
+        q = q.where(EstagiarioResumo.termino_contrato_atual <= termino_ate)
+
+    pendencias = []
+    for r in conn.execute(q):
+        saldo = int(dias_adquiridos(r, ate=r.termino_contrato_atual) - r.dias_usufruidos)
+        if saldo > 0:
+            pendencias.append({
+                "id_estagiario": r.id_estagiario,
+                "nome": r.nome,
+                "lotacao": r.lotacao,
+                "inicio": r.inicio_contrato_atual,
+                "termino": r.termino_contrato_atual,
+                "saldo": saldo,
+            })
+    return pendencias
+
+
+def carregar_ferias_futuras(conn, hoje=None):
+    hoje = hoje or date.today()
+    q = (
+        select(Ferias.id_estagiario, Estagiario.lotacao, Ferias.periodo_inicio, Ferias.periodo_fim)
+        .join(Estagiario, Estagiario.id_estagiario == Ferias.id_estagiario)
+        .where(Ferias.periodo_fim >= hoje)
+    )
+    return [tuple(r) for r in conn.execute(q)]
+
+
+def escalonar(pendencias, ferias_existentes=(), limites=None, limite_padrao=1, hoje=None):
+    """Retorna (propostas, sem_janela).
+
+    `pendencias`: dicts com id_estagiario, lotacao, termino, saldo (e
+    opcionalmente inicio, nome). `ferias_existentes`: tuplas
+    (id_estagiario, lotacao, inicio, fim). `limites`: {lotacao: máximo de
+    estagiários de férias no mesmo dia}; as demais usam `limite_padrao`.
+    """
+    hoje = hoje or date.today()
+    limites = limites or {}
+    pendencias = [p for p in pendencias if p["saldo"] > 0 and p["termino"] >= hoje]
+    if not pendencias:
+        return [], []
+
+    horizonte = (max(p["termino"] for p in pendencias) - hoje).days + 1
+    dias = np.datetime64(hoje, "D") + np.arange(horizonte)
+
+    # Ocupação já comprometida por lotação (array de diferenças -> cumsum)
+    ocupacao, bloqueios = {}, {}
+    for id_est, lotacao, ini, fim in ferias_existentes:
+        a, b = max((ini - hoje).days, 0), min((fim - hoje).days, horizonte - 1)
+        if a > b:
+            continue
+        diff = ocupacao.setdefault(lotacao or "", np.zeros(horizonte + 1, dtype="int64"))
+        diff[a] += 1
+        diff[b + 1] -= 1
+        bloqueios.setdefault(id_est, []).append((a, b))
+    ocupacao = {l: np.cumsum(d[:-1]) for l, d in ocupacao.items()}
+
+    uteis = {}
+    propostas, sem_janela = [], []
+
+    fila = [(p["termino"], -p["saldo"], i) for i, p in enumerate(pendencias)]
+    heapq.heapify(fila)
+    while fila:
+        termino, _, i = heapq.heappop(fila)
+        p = pendencias[i]
+        lotacao = p["lotacao"] or ""
+        dias_ferias = p["saldo"]
+        ultimo = (termino - hoje).days  # último dia (índice) em que pode estar de férias
+        primeiro = max((p["inicio"] - hoje).days, 0) if p.get("inicio") else 0
+
+        if ultimo - primeiro + 1 < dias_ferias:
+            sem_janela.append(p)
+            continue
+
+        occ = ocupacao.setdefault(lotacao, np.zeros(horizonte, dtype="int64"))
+        if lotacao not in uteis:
+            uteis[lotacao] = np.is_busday(dias, busdaycal=calendario(lotacao or None))
+
+        livre = occ[:ultimo + 1] < limites.get(lotacao, limite_padrao)
+        for a, b in bloqueios.get(p["id_estagiario"], ()):
+            livre[a:b + 1] = False
+
+        # cabe[s]: os dias s .. s+dias_ferias-1 estão todos livres
+        ocupados = np.concatenate(([0], np.cumsum(~livre)))
+        cabe = (ocupados[dias_ferias:] - ocupados[:-dias_ferias]) == 0
+        cabe &= uteis[lotacao][:len(cabe)]
+        cabe[:primeiro] = False
+
+        inicios = np.flatnonzero(cabe)
+        if not inicios.size:
+            sem_janela.append(p)
+            continue
+
+        s = int(inicios[0])
+        occ[s:s + dias_ferias] += 1
+        bloqueios.setdefault(p["id_estagiario"], []).append((s, s + dias_ferias - 1))
+        propostas.append(dict(
+            p,
+            periodo_inicio=dias[s].item(),
+            periodo_fim=dias[s + dias_ferias - 1].item(),
+            dias=dias_ferias,
+        ))
+
+    return propostas, sem_janela
@@ -0,0 +1,101 @@
+from datetime import date
+from sqlalchemy import Column, Integer, String, Date, DateTime, Float, Text, ForeignKey, LargeBinary
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship, deferred
+
+Base = declarative_base()
+
+
+# ---------------------------
+# Models
+# ---------------------------
+
+class Estagiario(Base):
+    __tablename__ = "estagiarios"
+    id_estagiario = Column(Integer, primary_key=True)
+    nome = Column(String(150), nullable=False)
+    curso = Column(String(150), nullable=True)
+    semestre = Column(String(20), nullable=True)
+    lotacao = Column(String(100), nullable=True)
+    supervisor = Column(String(150), nullable=True)
+    turno = Column(String(20), nullable=True)
+    status = Column(String(10), nullable=False, default="Ativo")
+
+
+    contratos = relationship("Contrato", back_populates="estagiario", cascade="all, delete-orphan")
+    ferias = relationship("Ferias", back_populates="estagiario", cascade="all, delete-orphan")
+
+class Contrato(Base):
+    __tablename__ = "contrato"
+    id_contrato = Column(Integer, primary_key=True)
+    id_estagiario = Column(Integer, ForeignKey("estagiarios.id_estagiario", ondelete="CASCADE"), nullable=False)
+    data_inicio = Column(Date, nullable=False)
+    data_termino = Column(Date, nullable=False)
+    status = Column(String(20), nullable=True)
+    substituindo = Column(String(120), nullable=True)
+    obs = Column(Text, nullable=True)
+    tipo_contrato = Column(String(20), nullable=True)
+    id_contrato_anterior = Column(Integer, ForeignKey("contrato.id_contrato"), nullable=True)
+
+    estagiario = relationship("Estagiario", back_populates="contratos")
+
+class Ferias(Base):
+    __tablename__ = "ferias"
+    id_ferias = Column(Integer, primary_key=True)
+    id_estagiario = Column(Integer, ForeignKey("estagiarios.id_estagiario", ondelete="CASCADE"), nullable=False)
+    periodo_inicio = Column(Date, nullable=False)
+    periodo_fim = Column(Date, nullable=False)
+    dias_usufruidos = Column(String(50), nullable=True)
+    memorando = Column(String(100), nullable=True)
+
+    estagiario = relationship("Estagiario", back_populates="ferias")
+
+class TermoCompromisso(Base):
+    __tablename__ = "termos_compromisso"
+
+    id_termo = Column(Integer, primary_key=True)
+    id_contrato = Column(
+        Integer,
+        ForeignKey("contrato.id_contrato", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    nome_arquivo = Column(String(255), nullable=False)
+    mime_type = Column(String(100))
+    tamanho_arquivo = Column(Integer)
+
+    # 👈 AGORA O PDF FICA AQUI. Carregado só quando acessado: consultar o termo
+    # não lê o BLOB (no SQLite ele ocupa páginas de overflow do mesmo arquivo)
+    arquivo = deferred(Column(LargeBinary, nullable=False))
+
+    data_upload = Column(Date, default=date.today)
+
+    contrato = relationship("Contrato")
+
+class Administrador(Base):
+    __tablename__ = "administrador"  # Nome exato da tabela
+    id_adm = Column(Integer, primary_key=True)
+    nome = Column(String(150))
+    email = Column(String(150), unique=True, nullable=False)
+    senha_hash = Column(String(255), nullable=False) # Coluna onde o hash será lido
+
+class EstagiarioResumo(Base):
+    # Tabela desnormalizada, mantida por resumo.py a cada flush de Contrato/Ferias
+    __tablename__ = "estagiario_resumo"
+    id_estagiario = Column(
+        Integer,
+        ForeignKey("estagiarios.id_estagiario", ondelete="CASCADE"),
+        primary_key=True
+    )
+    total_contratos = Column(Integer, nullable=False, default=0)
+    contratos_encerrados = Column(Integer, nullable=False, default=0)
+    id_contrato_atual = Column(Integer, nullable=True)
+    inicio_contrato_atual = Column(Date, nullable=True)
+    termino_contrato_atual = Column(Date, nullable=True)
+    primeiro_inicio = Column(Date, nullable=True)
+    ultimo_termino = Column(Date, nullable=True)
+    dias_contratados = Column(Integer, nullable=False, default=0)
+    dias_usufruidos = Column(Float, nullable=False, default=0)
+    atualizado_em = Column(DateTime, nullable=True)
+
+    estagiario = relationship("Estagiario")
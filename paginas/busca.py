@@ -0,0 +1,52 @@
+import math
+import streamlit as st
+from banco import SessionLocal
+from busca import buscar, POR_PAGINA
+
+# ---------------------------
+# BUSCA
+# ---------------------------
+
+st.header("🔎 Busca")
+
+db = SessionLocal()
+
+termo = st.session_state.get("busca_global", "")
+
+if not termo:
+    st.info("Digite um termo na busca da barra lateral (nome, observação, substituto, memorando...).")
+else:
+    # Volta para a primeira página quando o termo muda
+    if st.session_state.get("busca_termo_anterior") != termo:
+        st.session_state["busca_termo_anterior"] = termo
+        st.session_state["busca_pagina"] = 1
+
+    pagina_atual = st.session_state.get("busca_pagina", 1)
+    resultados, total = buscar(db.connection(), termo, pagina_atual)
+
+    if not resultados:
+        st.warning(f"Nenhum resultado para “{termo}”.")
+    else:
+        paginas = math.ceil(total / POR_PAGINA)
+        st.caption(f"{total} resultado(s) para “{termo}”")
+
+        rotulos = {
+            "estagiario": "🧑‍🎓 Estagiário",
+            "contrato": "📝 Contrato",
+            "ferias": "🏖️ Férias"
+        }
+
+        for r in resultados:
+            with st.container(border=True):
+                st.markdown(f"**{rotulos[r['tipo']]} #{r['ref_id']}** — {r['titulo']}")
+                if r["trecho"]:
+                    st.markdown(r["trecho"])
+
+        if paginas > 1:
+            st.number_input(
+                f"Página (de {paginas})",
+                min_value=1,
+                max_value=paginas,
+                step=1,
+                key="busca_pagina"
+            )
@@ -0,0 +1,152 @@
+from datetime import date, timedelta
+import streamlit as st
+from banco import SessionLocal
+from models import Estagiario, Contrato, EstagiarioResumo
+from resumo import dias_adquiridos
+from calendario import proximo_dia_util
+
+# ---------------------------
+# CÁLCULO DE FÉRIAS
+# ---------------------------
+
+st.header("Cálculo de Férias")
+st.subheader("Calcular férias proporcionais (selecionando contratos)")
+
+db = SessionLocal()
+
+# 1) Pesquisar estagiário pelo nome
+nome_busca = st.text_input("Pesquisar estagiário por nome (parcial)")
+
+if nome_busca:
+    ests = db.query(Estagiario).filter(
+        Estagiario.nome.ilike(f"%{nome_busca}%")
+    ).all()
+
+    if not ests:
+        st.warning("Nenhum estagiário encontrado.")
+    else:
+        nomes_dict = {f"{e.id_estagiario} - {e.nome}": e.id_estagiario for e in ests}
+        escolha = st.selectbox("Selecione o estagiário", [""] + list(nomes_dict.keys()))
+
+        if escolha:
+            est_id = nomes_dict[escolha]
+
+            # Situação atual, lida do resumo (sem reagregar contratos e férias)
+            resumo = db.get(EstagiarioResumo, est_id)
+            if resumo and resumo.total_contratos:
+                adquiridos = dias_adquiridos(resumo)
+                r1, r2, r3, r4 = st.columns(4)
+                r1.metric("Contrato atual até", resumo.termino_contrato_atual.strftime("%d/%m/%Y")
+                          if resumo.termino_contrato_atual else "-")
+                r2.metric("Dias de contrato", resumo.dias_contratados)
+                r3.metric("Férias adquiridas", f"{adquiridos} dias")
+                r4.metric("Saldo (já descontado o usufruído)", f"{adquiridos - resumo.dias_usufruidos:g} dias")
+
+            # 2) Contratos do estagiário
+            contratos = db.query(Contrato).filter(
+                Contrato.id_estagiario == est_id
+            ).order_by(Contrato.data_inicio).all()
+
+            if not contratos:
+                st.error("Este estagiário não possui contratos cadastrados.")
+            else:
+                st.write("Selecione os contratos que farão parte do cálculo:")
+
+                marcados = []
+                for c in contratos:
+                    label = f"ID {c.id_contrato} | {c.data_inicio} → {c.data_termino}"
+                    if st.checkbox(label, key=f"calc_ctr_{c.id_contrato}"):
+                        marcados.append(c)
+
+                if marcados:
+
+                    # Data inicial do cálculo
+                    data_ini = min(c.data_inicio for c in marcados)
+
+                    # Data final padrão (maior término)
+                    data_contrato_fim = max(c.data_termino for c in marcados)
+
+                    hoje = date.today()
+
+                    # ---------------------------------
+                    # MODO DE CÁLCULO
+                    # ---------------------------------
+                    st.subheader("Modo de cálculo")
+
+                    modo = st.radio(
+                        "Selecione o tipo de cálculo:",
+                        (
+                            "Direito adquirido (até hoje)",
+                            "Projeção até o fim do contrato",
+                            "Informar data manualmente"
+                        )
+                    )
+
+                    if modo == "Direito adquirido (até hoje)":
+                        data_fim = hoje
+                        st.info("Cálculo considera apenas o tempo já trabalhado.")
+
+                    elif modo == "Projeção até o fim do contrato":
+                        data_fim = data_contrato_fim
+                        st.warning(
+                            "⚠️ Este é um cálculo de PROJEÇÃO. "
+                            "O direito só será adquirido se o contrato for cumprido até esta data."
+                        )
+
+                    else:
+                        data_fim = st.date_input(
+                            "Informe a data final desejada",
+                            value=hoje
+                        )
+                        st.warning("⚠️ Cálculo realizado com data informada manualmente.")
+
+                    # -------------------------------
+                    # VERIFICAÇÃO
+                    # -------------------------------
+                    if data_fim < data_ini:
+                        st.error("A data final não pode ser anterior à data inicial.")
+                    else:
+                        # -------------------------------
+                        # CÁLCULO PROPORCIONAL
+                        # -------------------------------
+                        dias_totais = (data_fim - data_ini).days + 1
+                        meses_equivalentes = dias_totais / 30
+                        direito_ferias = meses_equivalentes * 2.5
+
+                        # Arredondamento conforme norma administrativa
+                        dias_ferias_int = int(round(direito_ferias))
+
+                        # Exibição
+                        st.success("Resultado do cálculo:")
+                        st.write(f"📌 **Período considerado:** {data_ini} → {data_fim}")
+                        st.write(f"📌 **Dias totais considerados:** {dias_totais} dias")
+                        st.write(f"📌 **Meses equivalentes:** {meses_equivalentes:.2f}")
+                        st.write(f"🏖️ **Direito a férias:** **{dias_ferias_int} dias**")
+
+                        # -------------------------------
+                        # REDIRECIONAR PARA FÉRIAS
+                        # -------------------------------
+                        st.divider()
+                        st.subheader("Registrar férias com base neste cálculo")
+
+                        if st.button("➡️ Ir para Registro de Férias"):
+                            # Férias começam no primeiro dia útil após a data final do cálculo
+                            data_inicio_ferias = proximo_dia_util(
+                                data_fim + timedelta(days=1),
+                                db.get(Estagiario, est_id).lotacao
+                            )
+                            data_fim_ferias = data_inicio_ferias + timedelta(days=dias_ferias_int - 1)
+
+                            st.session_state["ferias_prefill"] = {
+                                "id_estagiario": est_id,
+                                "data_inicio": data_inicio_ferias,
+                                "data_fim": data_fim_ferias,
+                                "dias": dias_ferias_int
+                            }
+
+                            st.switch_page("paginas/ferias.py")
+
+                else:
+                    st.info("Selecione ao menos um contrato para realizar o cálculo.")
+
+db.close()
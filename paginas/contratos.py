@@ -0,0 +1,117 @@
+from datetime import date
+from dateutil.relativedelta import relativedelta
+import streamlit as st
+import re
+from banco import SessionLocal
+from models import Estagiario, Contrato
+from consultas import lista_estagiarios, tabela
+
+# ---------------------------
+# CONTRATOS
+# ---------------------------
+
+db = SessionLocal()
+
+st.header("Gestão de Contratos")
+aba1, aba2 = st.tabs(["Novo Contrato", "Ver / Editar Tudo"])
+
+estagiarios = lista_estagiarios()
+est_dict = {f"{nome} (ID: {id_est})": id_est for id_est, nome in estagiarios}
+
+# ---------------------------
+# NOVO CONTRATO
+# ---------------------------
+with aba1:
+    if not estagiarios:
+        st.warning("Cadastre um estagiário primeiro.")
+    else:
+        with st.form("add_ct", clear_on_submit=True):
+            nome_sel = st.selectbox("Estagiário", options=list(est_dict.keys()))
+            inicio = st.date_input("Início", date.today())
+            fim = st.date_input("Término", date.today() + relativedelta(months=6))
+            subst = st.text_input("Substituindo")
+            tipo = st.selectbox("Tipo", ["inicial", "renovacao"])
+            status_c = st.selectbox("Status", ["Ativo", "Encerrado", "Suspenso"])
+            obs = st.text_area("Observações")
+
+            submit_ct = st.form_submit_button("Gerar Contrato")
+
+        if submit_ct:
+            novo_c = Contrato(
+                id_estagiario=est_dict[nome_sel],
+                data_inicio=inicio,
+                data_termino=fim,
+                substituindo=subst,
+                obs=obs,
+                tipo_contrato=tipo,
+                status=status_c
+            )
+            db.add(novo_c)
+            db.commit()
+
+            st.success("✅ Contrato cadastrado com sucesso!")
+
+# ---------------------------
+# VER / EDITAR CONTRATOS
+# ---------------------------
+with aba2:
+    df_c = tabela(
+        db.query(
+            Contrato.id_contrato.label("ID"),
+            Estagiario.nome.label("Estagiário"),
+            Contrato.data_inicio.label("Início"),
+            Contrato.data_termino.label("Fim"),
+            Contrato.status.label("Status")
+        ).join(Estagiario),
+        datas=["Início", "Fim"]
+    )
+
+    if not df_c.empty:
+        st.dataframe(
+            df_c,
+            use_container_width=True,
+            column_config={
+                "Início": st.column_config.DateColumn(format="DD/MM/YYYY"),
+                "Fim": st.column_config.DateColumn(format="DD/MM/YYYY")
+            }
+        )
+
+        st.divider()
+        ct_sel = st.selectbox(
+            "Selecione Contrato para Editar",
+            [""] + ("ID " + df_c["ID"].astype(str) + " - " + df_c["Estagiário"]).tolist()
+        )
+
+        if ct_sel:
+            c_id = int(re.search(r"ID (\d+)", ct_sel).group(1))
+            c_obj = db.get(Contrato, c_id)
+
+            with st.form(f"edit_ct_{c_id}"):
+                c1, c2 = st.columns(2)
+                n_ini = c1.date_input("Data Início", c_obj.data_inicio)
+                n_fim = c2.date_input("Data Término", c_obj.data_termino)
+                n_sub = c1.text_input("Substituindo", c_obj.substituindo)
+                n_tipo = c2.selectbox(
+                    "Tipo",
+                    ["inicial", "renovacao"],
+                    index=0 if c_obj.tipo_contrato == "inicial" else 1
+                )
+                n_status = c1.selectbox(
+                    "Status",
+                    ["Ativo", "Encerrado", "Suspenso"],
+                    index=["Ativo", "Encerrado", "Suspenso"].index(c_obj.status)
+                    if c_obj.status in ["Ativo", "Encerrado", "Suspenso"] else 0
+                )
+                n_obs = st.text_area("Observações", c_obj.obs)
+
+                if st.form_submit_button("Salvar Alterações do Contrato"):
+                    c_obj.data_inicio = n_ini
+                    c_obj.data_termino = n_fim
+                    c_obj.substituindo = n_sub
+                    c_obj.tipo_contrato = n_tipo
+                    c_obj.status = n_status
+                    c_obj.obs = n_obs
+                    db.commit()
+
+                    st.success("✅ Contrato atualizado com sucesso!")
+                    st.rerun()
@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+import pandas as pd
+import streamlit as st
+from banco import SessionLocal
+from models import Estagiario, Contrato, Ferias, EstagiarioResumo
+from consultas import tabela
+
+# ---------------------------
+# DASHBOARD
+# ---------------------------
+
+db = SessionLocal()
+
+st.title("📊 Dashboard de Controle")
+
+# MÉTRICAS PRINCIPAIS
+# Estagiário ativo = aquele que possui pelo menos um contrato que NÃO está encerrado.
+# O resumo já guarda isso (id_contrato_atual, status comparado sem caixa):
+# uma contagem na tabela de resumo em vez de agregar os contratos a cada rerun
+ativos_count = db.query(EstagiarioResumo).filter(EstagiarioResumo.id_contrato_atual.isnot(None)).count()
+total_contratos = db.query(Contrato).count()
+
+c1, c2 = st.columns(2)
+c1.metric("Estagiários Ativos", ativos_count)
+c2.metric("Contratos Totais", total_contratos)
+
+st.divider()
+
+# SEÇÃO DE ALERTAS E VENCIMENTOS
+col_venc, col_ferias = st.columns(2)
+
+with col_venc:
+    st.subheader("📅 Contratos a Vencer")
+    prazo = st.radio("Período:", ["1 semana", "30 dias", "60 dias"], horizontal=True)
+    dias_map = {"1 semana": 7, "30 dias": 30, "60 dias": 60}
+    data_limite = date.today() + timedelta(days=dias_map[prazo])
+
+    vencendo = tabela(
+        db.query(
+            Estagiario.nome.label("Estagiário"),
+            Contrato.data_termino.label("Vencimento")
+        ).join(Estagiario).filter(
+            Contrato.status != "Encerrado", # Apenas os que ainda estão ativos
+            Contrato.data_termino >= date.today(),
+            Contrato.data_termino <= data_limite
+        ),
+        datas=["Vencimento"]
+    )
+
+    if not vencendo.empty:
+        vencendo["Dias Restantes"] = (vencendo["Vencimento"] - pd.Timestamp(date.today())).dt.days
+        st.dataframe(
+            vencendo,
+            use_container_width=True,
+            column_config={"Vencimento": st.column_config.DateColumn(format="DD/MM/YYYY")}
+        )
+    else:
+        st.info("Nenhum contrato vencendo no período selecionado.")
+
+with col_ferias:
+    st.subheader("🏖️ Estagiários em Férias")
+    hoje = date.today()
+    em_ferias = tabela(
+        db.query(
+            Estagiario.nome.label("Nome"),
+            Ferias.periodo_fim.label("Retorno")
+        ).join(Estagiario).filter(
+            Ferias.periodo_inicio <= hoje,
+            Ferias.periodo_fim >= hoje
+        ),
+        datas=["Retorno"]
+    )
+
+    if not em_ferias.empty:
+        em_ferias["Dias para voltar"] = (em_ferias["Retorno"] - pd.Timestamp(hoje)).dt.days
+        em_ferias["Retorno"] = em_ferias["Retorno"].dt.strftime("%d/%m/%Y")
+        st.table(em_ferias)
+    else:
+        st.write("Não há estagiários em férias no momento.")
+
+# NOVO BLOCO: CICLO CONCLUÍDO (4 CONTRATOS ENCERRADOS)
+st.divider()
+
+# Busca estagiários que (direto do resumo, uma linha por estagiário):
+# 1. Têm 4 ou mais contratos
+# 2. Nenhum desses contratos está ativo (todos encerrados)
+concluidos = db.query(Estagiario).join(EstagiarioResumo).filter(
+    EstagiarioResumo.total_contratos >= 4,
+    EstagiarioResumo.contratos_encerrados == EstagiarioResumo.total_contratos
+).all()
+
+if concluidos:
+    st.subheader("🎓 Ciclo de Estágio Concluído")
+    for est in concluidos:
+        st.success(f"✨ **{est.nome}** finalizou sua jornada! Este estagiário completou todos os 4 períodos de contrato permitidos e todos constam como encerrados no sistema.")
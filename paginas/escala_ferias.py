@@ -0,0 +1,107 @@
+from datetime import date, timedelta
+import time
+import pandas as pd
+import streamlit as st
+from banco import SessionLocal
+from models import Ferias
+from escalonador import carregar_pendencias, carregar_ferias_futuras, escalonar
+
+# ---------------------------
+# ESCALA DE FÉRIAS
+# ---------------------------
+
+st.header("🗓️ Escala de Férias")
+st.caption(
+    "Propõe férias para todos os contratos ativos com saldo, antes do término do contrato, "
+    "respeitando as férias já registradas e o limite de estagiários de férias por lotação."
+)
+
+db = SessionLocal()
+
+if "msg_escala" in st.session_state:
+    st.success(st.session_state.pop("msg_escala"))
+
+col1, col2 = st.columns(2)
+prazo = col1.number_input("Contratos que terminam em até (dias)", min_value=1, value=180, step=30)
+limite_padrao = col2.number_input("Máximo de estagiários de férias por lotação no mesmo dia",
+                                  min_value=1, value=1, step=1)
+
+hoje = date.today()
+pendencias = carregar_pendencias(db.connection(), hoje, hoje + timedelta(days=int(prazo)))
+
+if not pendencias:
+    st.info("Nenhum contrato ativo com saldo de férias no período.")
+else:
+    # Limites por lotação (opcional): sobrepõem o máximo padrão
+    lotacoes = sorted({p["lotacao"] or "" for p in pendencias})
+    with st.expander("Limites por lotação"):
+        df_limites = st.data_editor(
+            pd.DataFrame({"Lotação": lotacoes, "Limite": int(limite_padrao)}),
+            hide_index=True,
+            disabled=["Lotação"],
+            column_config={
+                "Limite": st.column_config.NumberColumn(required=True, min_value=1, step=1)
+            },
+            key="escala_limites"
+        )
+    # Célula apagada chega como NaN: volta para o máximo padrão
+    limites = dict(zip(
+        df_limites["Lotação"],
+        df_limites["Limite"].fillna(limite_padrao).clip(lower=1).astype(int)
+    ))
+
+    t0 = time.perf_counter()
+    propostas, sem_janela = escalonar(
+        pendencias,
+        carregar_ferias_futuras(db.connection(), hoje),
+        limites=limites,
+        limite_padrao=int(limite_padrao),
+        hoje=hoje
+    )
+    st.caption(f"{len(pendencias)} contratos escalonados em {(time.perf_counter() - t0) * 1e3:.0f} ms")
+
+    if sem_janela:
+        st.warning(
+            f"⚠️ {len(sem_janela)} estagiário(s) sem janela disponível antes do fim do contrato: "
+            + ", ".join(p["nome"] for p in sem_janela)
+        )
+
+    if propostas:
+        df_prop = pd.DataFrame(propostas)
+        df_prop.insert(0, "Registrar", True)
+
+        editado = st.data_editor(
+            df_prop[["Registrar", "id_estagiario", "nome", "lotacao", "termino",
+                     "saldo", "periodo_inicio", "periodo_fim"]],
+            hide_index=True,
+            use_container_width=True,
+            disabled=["id_estagiario", "nome", "lotacao", "termino", "saldo",
+                      "periodo_inicio", "periodo_fim"],
+            column_config={
+                "id_estagiario": "ID",
+                "nome": "Estagiário",
+                "lotacao": "Lotação",
+                "termino": st.column_config.DateColumn("Fim do contrato", format="DD/MM/YYYY"),
+                "saldo": "Dias",
+                "periodo_inicio": st.column_config.DateColumn("Início", format="DD/MM/YYYY"),
+                "periodo_fim": st.column_config.DateColumn("Fim", format="DD/MM/YYYY")
+            },
+            key="escala_propostas"
+        )
+
+        selecionadas = editado[editado["Registrar"]]
+        if st.button(f"💾 Registrar {len(selecionadas)} férias", disabled=selecionadas.empty):
+            db.add_all([
+                Ferias(
+                    id_estagiario=int(r.id_estagiario),
+                    periodo_inicio=pd.Timestamp(r.periodo_inicio).date(),
+                    periodo_fim=pd.Timestamp(r.periodo_fim).date(),
+                    dias_usufruidos=str(int(r.saldo)),
+                    memorando="Escala automática"
+                )
+                for r in selecionadas.itertuples()
+            ])
+            db.commit()
+
+            st.session_state["msg_escala"] = f"✅ {len(selecionadas)} férias registradas!"
+            st.rerun()
@@ -0,0 +1,147 @@
+import streamlit as st
+from banco import SessionLocal
+from models import Estagiario
+
+# ---------------------------
+# ESTAGIÁRIOS
+# ---------------------------
+
+db = SessionLocal()
+
+st.header("Gestão de Estagiários")
+aba1, aba2 = st.tabs(["Cadastrar Novo", "Ver / Editar Tudo"])
+
+# =====================================================
+# ABA 1 — CADASTRO
+# =====================================================
+with aba1:
+    with st.form("add_est", clear_on_submit=True):
+        nome = st.text_input("Nome completo", key="est_nome")
+        curso = st.text_input("Curso", key="est_curso")
+        semestre = st.text_input("Semestre", key="est_semestre")
+        lotacao = st.text_input("Lotação", key="est_lotacao")
+        supervisor = st.text_input("Supervisor", key="est_supervisor")
+        turno = st.selectbox(
+            "Turno",
+            ["Manhã", "Tarde", "Integral"],
+            key="est_turno"
+        )
+
+        submit = st.form_submit_button("Salvar Estagiário")
+
+    if submit:
+        novo = Estagiario(
+            nome=nome,
+            curso=curso,
+            semestre=semestre,
+            lotacao=lotacao,
+            supervisor=supervisor,
+            turno=turno,
+            status="Ativo"   # 🔹 já nasce ativo
+        )
+        db.add(novo)
+        db.commit()
+
+        st.success("✅ Estagiário cadastrado com sucesso!")
+
+        # Limpa campos manualmente (garantia extra)
+        for k in [
+            "est_nome", "est_curso", "est_semestre",
+            "est_lotacao", "est_supervisor", "est_turno"
+        ]:
+            if k in st.session_state:
+                del st.session_state[k]
+
+# =====================================================
+# ABA 2 — VER / EDITAR
+# =====================================================
+with aba2:
+    lista_est = db.query(Estagiario).order_by(Estagiario.nome).all()
+
+    if not lista_est:
+        st.info("Nenhum estagiário cadastrado.")
+    else:
+        st.subheader("📋 Lista de Estagiários")
+
+        for e in lista_est:
+            with st.container():
+                col1, col2, col3 = st.columns([6, 2, 2])
+
+                # -------- COLUNA 1 — DADOS COMPLETOS --------
+                col1.markdown(
+                    f"""
+                    **{e.nome}**  
+                    📘 Curso: {e.curso or "-"}  
+                    🎓 Semestre: {e.semestre or "-"}  
+                    🏢 Lotação: {e.lotacao or "-"}  
+                    👤 Supervisor: {e.supervisor or "-"}  
+                    ⏰ Turno: {e.turno or "-"}
+                    """
+                )
+
+                # -------- COLUNA 2 — STATUS --------
+                if e.status == "Ativo":
+                    col2.success("🟢 Ativo")
+                else:
+                    col2.error("🔴 Inativo")
+
+                # -------- COLUNA 3 — BOTÃO --------
+                if e.status == "Ativo":
+                    if col3.button(
+                        "Desativar",
+                        key=f"desativar_{e.id_estagiario}"
+                    ):
+                        e.status = "Inativo"
+                        db.commit()
+                        st.rerun()
+                else:
+                    if col3.button(
+                        "Ativar",
+                        key=f"ativar_{e.id_estagiario}"
+                    ):
+                        e.status = "Ativo"
+                        db.commit()
+                        st.rerun()
+
+                st.divider()
+
+
+
+        # ----- EDIÇÃO COMPLETA -----
+        st.subheader("✏️ Editar Informações")
+
+        selected_est = st.selectbox(
+            "Selecione para editar",
+            [""] + [f"{e.id_estagiario} - {e.nome}" for e in lista_est]
+        )
+
+        if selected_est:
+            est_id = int(selected_est.split(" - ")[0])
+            est_obj = db.get(Estagiario, est_id)
+
+            with st.form(f"edit_est_{est_id}"):
+                col1, col2 = st.columns(2)
+
+                new_nome = col1.text_input("Nome", est_obj.nome)
+                new_curso = col2.text_input("Curso", est_obj.curso)
+                new_sem = col1.text_input("Semestre", est_obj.semestre)
+                new_lot = col2.text_input("Lotação", est_obj.lotacao)
+                new_sup = col1.text_input("Supervisor", est_obj.supervisor)
+                new_turno = col2.selectbox(
+                    "Turno",
+                    ["Manhã", "Tarde", "Integral"],
+                    index=["Manhã", "Tarde", "Integral"].index(est_obj.turno)
+                    if est_obj.turno in ["Manhã", "Tarde", "Integral"] else 0
+                )
+
+                if st.form_submit_button("Atualizar Cadastro"):
+                    est_obj.nome = new_nome
+                    est_obj.curso = new_curso
+                    est_obj.semestre = new_sem
+                    est_obj.lotacao = new_lot
+                    est_obj.supervisor = new_sup
+                    est_obj.turno = new_turno
+                    db.commit()
+
+                    st.success("✅ Dados atualizados com sucesso!")
+                    st.rerun()
@@ -0,0 +1,185 @@
+from datetime import date
+import pandas as pd
+import streamlit as st
+from banco import SessionLocal
+from models import Estagiario, Ferias
+from consultas import lista_estagiarios, tabela
+from calendario import dias_uteis, data_retorno, dias_uteis_lote, datas_retorno_lote
+
+# ---------------------------
+# FÉRIAS
+# ---------------------------
+
+st.header("Gestão de Férias")
+
+aba1, aba2 = st.tabs(["Registrar Férias", "Férias Concedidas"])
+
+db = SessionLocal()
+
+# =====================================================
+# ABA 1 — REGISTRAR FÉRIAS
+# =====================================================
+with aba1:
+    # ---------------------------------
+    # MENSAGEM DE SUCESSO (APÓS RERUN)
+    # ---------------------------------
+    if "msg_ferias" in st.session_state:
+        st.success(st.session_state["msg_ferias"])
+        del st.session_state["msg_ferias"]
+
+    # ---------------------------------
+    # PRÉ-PREENCHIMENTO VINDO DO CÁLCULO
+    # ---------------------------------
+    prefill = st.session_state.get("ferias_prefill")
+
+    if prefill:
+        est_id_prefill = prefill["id_estagiario"]
+        data_ini_prefill = prefill["data_inicio"]
+        data_fim_prefill = prefill["data_fim"]
+        dias_prefill = prefill["dias"]
+    else:
+        est_id_prefill = None
+        data_ini_prefill = date.today()
+        data_fim_prefill = date.today()
+        dias_prefill = 0
+
+    # -----------------------------
+    # SELEÇÃO DO ESTAGIÁRIO
+    # -----------------------------
+    est_dict = {
+        f"{id_est} - {nome}": id_est
+        for id_est, nome in lista_estagiarios()
+    }
+
+    est_sel = st.selectbox(
+        "Selecione o estagiário",
+        [""] + list(est_dict.keys()),
+        index=list(est_dict.values()).index(est_id_prefill) + 1
+        if est_id_prefill else 0,
+        key="select_estagiario_ferias"
+    )
+
+    if est_sel:
+        est_id = est_dict[est_sel]
+
+        st.divider()
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            data_inicio = st.date_input(
+                "Data de início das férias",
+                value=data_ini_prefill,
+                key="data_inicio_ferias"
+            )
+
+        with col2:
+            data_fim = st.date_input(
+                "Data de fim das férias",
+                value=data_fim_prefill,
+                key="data_fim_ferias"
+            )
+
+        dias_calculados = (data_fim - data_inicio).days + 1
+
+        # Dias úteis e retorno pelo calendário de feriados da lotação
+        if data_fim >= data_inicio:
+            lotacao_est = db.get(Estagiario, est_id).lotacao
+            st.caption(
+                f"📆 {dias_uteis(data_inicio, data_fim, lotacao_est)} dias úteis no período · "
+                f"retorno em {data_retorno(data_fim, lotacao_est):%d/%m/%Y}"
+            )
+
+        dias_usufruidos = st.number_input(
+            "Dias de férias",
+            min_value=1,
+            value=dias_calculados if dias_prefill == 0 else dias_prefill,
+            step=1,
+            key="dias_ferias"
+        )
+
+        memorando = st.text_input(
+            "Memorando / Observação",
+            key="memo_ferias"
+        )
+
+        # -----------------------------
+        # SALVAR FÉRIAS
+        # -----------------------------
+        if st.button("💾 Registrar Férias"):
+            if data_fim < data_inicio:
+                st.error("❌ A data final não pode ser anterior à data inicial.")
+            else:
+                nova_ferias = Ferias(
+                    id_estagiario=est_id,
+                    periodo_inicio=data_inicio,
+                    periodo_fim=data_fim,
+                    dias_usufruidos=dias_usufruidos,
+                    memorando=memorando
+                )
+
+                db.add(nova_ferias)
+                db.commit()
+
+                # Mensagem persistente
+                st.session_state["msg_ferias"] = "✅ Férias registradas com sucesso!"
+
+                # Limpa prefill e formulário
+                for k in [
+                    "ferias_prefill",
+                    "select_estagiario_ferias",
+                    "data_inicio_ferias",
+                    "data_fim_ferias",
+                    "dias_ferias",
+                    "memo_ferias"
+                ]:
+                    if k in st.session_state:
+                        del st.session_state[k]
+
+                st.rerun()
+
+# =====================================================
+# ABA 2 — VISUALIZAR FÉRIAS CONCEDIDAS
+# =====================================================
+with aba2:
+    st.subheader("📋 Férias Concedidas")
+
+    df_ferias = tabela(
+        db.query(
+            Estagiario.nome.label("Estagiário"),
+            Ferias.periodo_inicio.label("Início"),
+            Ferias.periodo_fim.label("Fim"),
+            Ferias.dias_usufruidos.label("Dias"),
+            Ferias.memorando.label("Memorando"),
+            Estagiario.lotacao.label("lotacao")
+        )
+        .join(
+            Estagiario,
+            Ferias.id_estagiario == Estagiario.id_estagiario
+        )
+        .order_by(Ferias.periodo_inicio.desc()),
+        datas=["Início", "Fim"]
+    )
+
+    if df_ferias.empty:
+        st.info("Nenhuma férias registrada.")
+    else:
+        lotacoes = df_ferias.pop("lotacao").to_numpy()
+        df_ferias.insert(
+            3, "Dias úteis",
+            dias_uteis_lote(df_ferias["Início"].to_numpy(), df_ferias["Fim"].to_numpy(), lotacoes)
+        )
+        df_ferias.insert(
+            4, "Retorno",
+            pd.Series(datas_retorno_lote(df_ferias["Fim"].to_numpy(), lotacoes)).dt.strftime("%d/%m/%Y")
+        )
+        df_ferias["Início"] = df_ferias["Início"].dt.strftime("%d/%m/%Y")
+        df_ferias["Fim"] = df_ferias["Fim"].dt.strftime("%d/%m/%Y")
+
+        st.dataframe(
+            df_ferias,
+            use_container_width=True,
+            hide_index=True
+        )
+
+db.close()
@@ -0,0 +1,43 @@
+import streamlit as st
+from consultas import cache_serie_mensal, carregar_contratos_relatorio
+from versoes import versao
+
+# ---------------------------
+# RELATÓRIOS
+# ---------------------------
+
+st.header("📈 Histórico Mensal")
+st.caption("Headcount, contratações, renovações e desligamentos por mês.")
+
+agrupar = st.radio("Agrupar por:", ["Total", "Lotação", "Curso"], horizontal=True)
+por = {"Total": None, "Lotação": "lotacao", "Curso": "curso"}[agrupar]
+
+serie = cache_serie_mensal().obter(
+    carregar_contratos_relatorio,
+    versao("contrato", "estagiarios"),
+    por=por
+)
+
+if serie.empty:
+    st.info("Nenhum contrato cadastrado.")
+else:
+    serie["mes"] = serie["mes"].astype(str)
+
+    if por:
+        st.line_chart(serie.pivot(index="mes", columns=por, values="ativos"))
+    else:
+        st.line_chart(serie.set_index("mes")[["ativos"]])
+
+    st.dataframe(
+        serie.rename(columns={
+            "mes": "Mês",
+            "lotacao": "Lotação",
+            "curso": "Curso",
+            "ativos": "Ativos",
+            "contratacoes": "Contratações",
+            "renovacoes": "Renovações",
+            "desligamentos": "Desligamentos"
+        }),
+        use_container_width=True,
+        hide_index=True
+    )
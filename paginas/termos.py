@@ -0,0 +1,104 @@
+from datetime import date
+from functools import partial
+import streamlit as st
+from banco import SessionLocal
+from models import TermoCompromisso
+from consultas import lista_estagiarios, lista_contratos, arquivo_termo
+
+# ---------------------------
+# TERMOS DE COMPROMISSO
+# ---------------------------
+
+st.header("📄 Gestão de Termos de Compromisso")
+
+db = SessionLocal()
+
+est_dict = {
+    f"{id_est} - {nome}": id_est
+    for id_est, nome in lista_estagiarios()
+}
+
+est_sel = st.selectbox(
+    "Selecione o estagiário",
+    [""] + list(est_dict.keys())
+)
+
+if est_sel:
+    est_id = est_dict[est_sel]
+
+    contratos = lista_contratos(est_id)
+
+    if not contratos:
+        st.warning("Este estagiário não possui contratos.")
+    else:
+        contrato_dict = {
+            f"ID {id_c} | {ini} → {fim}": id_c
+            for id_c, ini, fim in contratos
+        }
+
+        ct_sel = st.selectbox(
+            "Selecione o contrato",
+            [""] + list(contrato_dict.keys())
+        )
+
+        if ct_sel:
+            c_id = contrato_dict[ct_sel]
+
+            st.divider()
+            st.subheader("Termo de Compromisso")
+
+            termo = db.query(TermoCompromisso).filter(
+                TermoCompromisso.id_contrato == c_id
+            ).first()
+
+            if termo:
+                st.success("✅ Termo de compromisso cadastrado")
+                st.write(f"📄 Arquivo: **{termo.nome_arquivo}**")
+
+                # O PDF só sai do banco quando o usuário clica em baixar
+                st.download_button(
+                    "⬇️ Baixar Termo de Compromisso",
+                    data=partial(arquivo_termo, termo.id_termo),
+                    file_name=termo.nome_arquivo,
+                    mime=termo.mime_type
+                )
+
+                if st.button("🔄 Substituir Termo"):
+                    st.session_state["substituir_termo"] = True
+
+            if not termo or st.session_state.get("substituir_termo"):
+
+                arquivo = st.file_uploader(
+                    "Enviar Termo de Compromisso (PDF)",
+                    type=["pdf"]
+                )
+
+                if arquivo:
+                    if st.button("💾 Salvar Termo"):
+                        conteudo = arquivo.read()
+
+                        if termo:
+                            # ATUALIZA TERMO EXISTENTE
+                            termo.nome_arquivo = arquivo.name
+                            termo.mime_type = arquivo.type
+                            termo.tamanho_arquivo = len(conteudo)
+                            termo.arquivo = conteudo
+                            termo.data_upload = date.today()
+                        else:
+                            # CRIA NOVO TERMO
+                            novo = TermoCompromisso(
+                                id_contrato=c_id,
+                                nome_arquivo=arquivo.name,
+                                mime_type=arquivo.type,
+                                tamanho_arquivo=len(conteudo),
+                                arquivo=conteudo
+                            )
+                            db.add(novo)
+
+                        db.commit()
+
+                        st.success("📄 Termo salvo com sucesso!")
+                        st.session_state.pop("substituir_termo", None)
+                        st.rerun()
+
+db.close()
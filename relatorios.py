@@ -0,0 +1,128 @@
+import threading
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Colunas esperadas no DataFrame de contratos
+COLUNAS_CONTRATOS = [
+    "id_contrato", "id_estagiario", "data_inicio", "data_termino",
+    "tipo_contrato", "lotacao", "curso",
+]
+METRICAS = ["ativos", "contratacoes", "renovacoes", "desligamentos"]
+
+
+def _meses(serie):
+    # Ordinal do mês (o mesmo de pd.Period "M") como inteiro, para aritmética vetorizada
+    d = pd.to_datetime(serie)
+    return ((d.dt.year - 1970) * 12 + d.dt.month - 1).to_numpy(dtype="int64")
+
+
+def serie_mensal(contratos, primeiro_mes, ultimo_mes, por=None, hoje=None):
+    """Headcount, contratações, renovações e desligamentos por mês.
+
+    `contratos` segue COLUNAS_CONTRATOS; `primeiro_mes`/`ultimo_mes` são
+    pd.Period mensais (inclusive); `por` é None, "lotacao" ou "curso".
+    Tudo vetorizado sobre os intervalos dos contratos, sem laço por linha.
+    """
+    hoje = hoje or date.today()
+    chaves = ["mes"] + ([por] if por else [])
+    ini_p, fim_p = primeiro_mes.ordinal, ultimo_mes.ordinal
+    meses = pd.period_range(primeiro_mes, ultimo_mes, freq="M")
+
+    if por:
+        grupos = contratos[por].fillna("Não informado").replace("", "Não informado")
+        contratos = contratos.assign(**{por: grupos})
+
+    if contratos.empty or fim_p < ini_p:
+        vazio = pd.DataFrame(columns=chaves + METRICAS)
+        return vazio.astype({m: "int64" for m in METRICAS})
+
+    m_ini = _meses(contratos["data_inicio"])
+    m_fim = _meses(contratos["data_termino"])
+
+    # Ativos: expande cada contrato nos meses que ele cobre dentro da janela
+    a = np.maximum(m_ini, ini_p)
+    b = np.minimum(m_fim, fim_p)
+    validos = np.flatnonzero(a <= b)
+    tam = (b - a + 1)[validos]
+    linhas = np.repeat(validos, tam)
+    desloc = np.arange(tam.sum()) - np.repeat(np.cumsum(tam) - tam, tam)
+    cobertura = pd.DataFrame({
+        "mes": np.repeat(a[validos], tam) + desloc,
+        "id_estagiario": contratos["id_estagiario"].to_numpy()[linhas],
+    })
+    if por:
+        cobertura[por] = contratos[por].to_numpy()[linhas]
+    ativos = cobertura.drop_duplicates().groupby(chaves).size().rename("ativos")
+
+    # Contratações / renovações: mês de início do contrato
+    na_janela = (m_ini >= ini_p) & (m_ini <= fim_p)
+    inicios = contratos.loc[na_janela, [por] if por else []].assign(mes=m_ini[na_janela])
+    renov = (contratos.loc[na_janela, "tipo_contrato"] == "renovacao").to_numpy()
+    contratacoes = inicios[~renov].groupby(chaves).size().rename("contratacoes")
+    renovacoes = inicios[renov].groupby(chaves).size().rename("renovacoes")
+
+    # Desligamentos: mês do último término de cada estagiário, se já passou
+    ultimo = contratos.assign(mes=m_fim).sort_values("data_termino")
+    ultimo = ultimo.drop_duplicates("id_estagiario", keep="last")
+    ultimo = ultimo[
+        (pd.to_datetime(ultimo["data_termino"]) < pd.Timestamp(hoje))
+        & ultimo["mes"].between(ini_p, fim_p)
+    ]
+    desligamentos = ultimo.groupby(chaves).size().rename("desligamentos")
+
+    resultado = pd.concat([ativos, contratacoes, renovacoes, desligamentos], axis=1)
+    if por:
+        indice = pd.MultiIndex.from_product(
+            [meses.asi8, sorted(contratos[por].unique())], names=chaves
+        )
+    else:
+        indice = pd.Index(meses.asi8, name="mes")
+    resultado = resultado.reindex(indice).fillna(0).astype("int64").reset_index()
+    resultado["mes"] = pd.PeriodIndex.from_ordinals(resultado["mes"], freq="M")
+    return resultado[chaves + METRICAS]
+
+
+class CacheSerieMensal:
+    """Cache incremental da série: meses fechados ficam guardados, o mês
+    corrente é sempre recalculado.
+
+    `carregar(desde)` devolve os contratos com data_termino >= desde (ou
+    todos, se desde for None). Quando a versão das tabelas muda, a parte
+    fechada é refeita; quando só o mês vira, calcula apenas os meses novos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._fechados = {}  # por -> (versao, ultimo_mes_fechado, DataFrame)
+
+    def obter(self, carregar, versao, por=None, hoje=None):
+        hoje = hoje or date.today()
+        mes_atual = pd.Period(hoje, freq="M")
+        ultimo_fechado = mes_atual - 1
+
+        with self._lock:
+            entrada = self._fechados.get(por)
+
+            if entrada is None or entrada[0] != versao:
+                contratos = carregar(None)
+                if contratos.empty:
+                    fechados = serie_mensal(contratos, mes_atual, ultimo_fechado, por, hoje)
+                else:
+                    primeiro = pd.Period(min(contratos["data_inicio"]), freq="M")
+                    fechados = serie_mensal(contratos, primeiro, ultimo_fechado, por, hoje)
+            else:
+                _, ate, fechados = entrada
+                if ate < ultimo_fechado:
+                    novos = carregar((ate + 1).start_time.date())
+                    fechados = pd.concat(
+                        [fechados, serie_mensal(novos, ate + 1, ultimo_fechado, por, hoje)],
+                        ignore_index=True,
+                    )
+
+            self._fechados[por] = (versao, ultimo_fechado, fechados)
+
+        atuais = carregar(mes_atual.start_time.date())
+        corrente = serie_mensal(atuais, mes_atual, mes_atual, por, hoje)
+        return pd.concat([fechados, corrente], ignore_index=True)
@@ -0,0 +1,213 @@
+"""Resumo por estagiário (tabela estagiario_resumo).
+
+Mantido pelos eventos da sessão a cada flush que toca Contrato, Ferias ou
+Estagiario, dentro da mesma transação. Também pode ser refeito ou conferido
+pela linha de comando:
+
+    python resumo.py reconstruir
+    python resumo.py verificar
+"""
+import re
+import sys
+from datetime import date, datetime
+
+from sqlalchemy import event, inspect, select
+
+from models import Estagiario, Contrato, Ferias, EstagiarioResumo
+
+CAMPOS = [
+    "total_contratos", "contratos_encerrados", "id_contrato_atual",
+    "inicio_contrato_atual", "termino_contrato_atual", "primeiro_inicio",
+    "ultimo_termino", "dias_contratados", "dias_usufruidos",
+]
+
+
+def _dias(valor):
+    # Mesmo critério de dias_usufruidos_total: o primeiro número do campo
+    m = re.search(r"(\d+)", str(valor)) if valor else None
+    return float(m.group(1)) if m else 0.0
+
+
+def calcular(conn, ids):
+    """Linhas do resumo calculadas a partir de contrato/ferias para os ids dados."""
+    ids = list(ids)
+    linhas = {
+        i: {
+            "id_estagiario": i, "total_contratos": 0, "contratos_encerrados": 0,
+            "id_contrato_atual": None, "inicio_contrato_atual": None,
+            "termino_contrato_atual": None, "primeiro_inicio": None,
+            "ultimo_termino": None, "dias_contratados": 0, "dias_usufruidos": 0.0,
+        }
+        for i in conn.execute(
+            select(Estagiario.id_estagiario).where(Estagiario.id_estagiario.in_(ids))
+        ).scalars()
+    }
+    if not linhas:
+        return linhas
+
+    contratos = conn.execute(
+        select(
+            Contrato.id_estagiario, Contrato.id_contrato, Contrato.data_inicio,
+            Contrato.data_termino, Contrato.status
+        )
+        .where(Contrato.id_estagiario.in_(list(linhas)))
+        .order_by(Contrato.data_inicio, Contrato.id_contrato)
+    )
+    for id_est, id_c, ini, fim, status in contratos:
+        r = linhas[id_est]
+        r["total_contratos"] += 1
+        r["dias_contratados"] += (fim - ini).days + 1
+        r["primeiro_inicio"] = min(filter(None, [r["primeiro_inicio"], ini]))
+        r["ultimo_termino"] = max(filter(None, [r["ultimo_termino"], fim]))
+        if (status or "").lower() == "encerrado":
+            r["contratos_encerrados"] += 1
+        else:
+            # Contrato atual: o não encerrado mais recente (ordem por início)
+            r["id_contrato_atual"] = id_c
+            r["inicio_contrato_atual"] = ini
+            r["termino_contrato_atual"] = fim
+
+    ferias = conn.execute(
+        select(Ferias.id_estagiario, Ferias.dias_usufruidos)
+        .where(Ferias.id_estagiario.in_(list(linhas)))
+    )
+    for id_est, dias in ferias:
+        linhas[id_est]["dias_usufruidos"] += _dias(dias)
+
+    return linhas
+
+
+def _insert(conn):
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(EstagiarioResumo.__table__)
+
+
+def atualizar(conn, ids):
+    ids = sorted(set(ids))
+    if not ids:
+        return
+    # Duas transações salvando o mesmo estagiário: a segunda espera aqui até
+    # a primeira terminar e só então calcula, já vendo o que ela gravou.
+    # NO KEY UPDATE não conflita com o KEY SHARE que a FK de contrato/ferias
+    # já tomou nessa linha, então não há deadlock entre as duas.
+    conn.execute(
+        select(Estagiario.id_estagiario)
+        .where(Estagiario.id_estagiario.in_(ids))
+        .order_by(Estagiario.id_estagiario)
+        .with_for_update(key_share=True)
+    ).all()
+    linhas = calcular(conn, ids)
+
+    tabela = EstagiarioResumo.__table__
+    removidos = [i for i in ids if i not in linhas]
+    if removidos:
+        conn.execute(tabela.delete().where(tabela.c.id_estagiario.in_(removidos)))
+    if linhas:
+        agora = datetime.now()
+        stmt = _insert(conn)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tabela.c.id_estagiario],
+            set_={c: stmt.excluded[c] for c in CAMPOS + ["atualizado_em"]},
+        )
+        conn.execute(stmt, [dict(r, atualizado_em=agora) for r in linhas.values()])
+
+
+def _manter(session, flush_context):
+    ids = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Estagiario):
+            if obj in session.new or obj in session.deleted:
+                ids.add(obj.id_estagiario)
+        elif isinstance(obj, (Contrato, Ferias)):
+            ids.add(obj.id_estagiario)
+            # Troca de estagiário: o antigo também precisa ser recalculado
+            hist = inspect(obj).attrs.id_estagiario.history
+            ids.update(i for i in hist.deleted if i is not None)
+    ids.discard(None)
+    if ids:
+        atualizar(session.connection(), ids)
+
+
+def _carregar_anterior(target, value, oldvalue, initiator):
+    # Só existe para ligar o active_history: o valor antigo vai para o histórico
+    pass
+
+
+def instalar_resumo(alvo):
+    """Recalcula, no mesmo flush, o resumo dos estagiários afetados (idempotente)."""
+    if not event.contains(alvo, "after_flush", _manter):
+        event.listen(alvo, "after_flush", _manter)
+    # Depois de um commit id_estagiario fica expirado; sem active_history a
+    # troca de estagiário não carrega o valor antigo, history.deleted vem
+    # vazio e o estagiário de origem ficaria com o resumo desatualizado
+    for atributo in (Contrato.id_estagiario, Ferias.id_estagiario):
+        if not event.contains(atributo, "set", _carregar_anterior):
+            event.listen(atributo, "set", _carregar_anterior, active_history=True)
+
+
+def reconstruir(engine):
+    with engine.begin() as conn:
+        ids = conn.execute(select(Estagiario.id_estagiario)).scalars().all()
+        conn.execute(EstagiarioResumo.__table__.delete())
+        atualizar(conn, ids)
+    return len(ids)
+
+
+def verificar(engine):
+    """Lista de (id_estagiario, campo, gravado, esperado) que não batem."""
+    with engine.connect() as conn:
+        return divergencias(conn)
+
+
+def divergencias(conn):
+    """Como verificar(), numa conexão já aberta (vê o que a transação dela alterou)."""
+    divergencias = []
+    ids = conn.execute(select(Estagiario.id_estagiario)).scalars().all()
+    esperado = calcular(conn, ids)
+    gravado = {
+        r.id_estagiario: r._mapping
+        for r in conn.execute(select(EstagiarioResumo.__table__))
+    }
+    for i in sorted(set(esperado) | set(gravado)):
+        if i not in gravado:
+            divergencias.append((i, "*", None, "ausente"))
+        elif i not in esperado:
+            divergencias.append((i, "*", "sobrando", None))
+        else:
+            for campo in CAMPOS:
+                if gravado[i][campo] != esperado[i][campo]:
+                    divergencias.append((i, campo, gravado[i][campo], esperado[i][campo]))
+    return divergencias
+
+
+def dias_adquiridos(resumo, ate=None):
+    """Direito a férias (2,5 dias a cada 30) do primeiro início até `ate`,
+    limitado ao último término — o mesmo cálculo da página de Cálculo de Férias."""
+    if not resumo or not resumo.primeiro_inicio:
+        return 0
+    fim = min(ate or date.today(), resumo.ultimo_termino)
+    if fim < resumo.primeiro_inicio:
+        return 0
+    return int(round(((fim - resumo.primeiro_inicio).days + 1) / 30 * 2.5))
+
+
+if __name__ == "__main__":
+    from banco import engine
+
+    if engine is None:
+        sys.exit("Defina a variável de ambiente DATABASE_URL.")
+
+    comando = sys.argv[1] if len(sys.argv) > 1 else ""
+    if comando == "reconstruir":
+        print(f"Resumo reconstruído para {reconstruir(engine)} estagiários.")
+    elif comando == "verificar":
+        problemas = verificar(engine)
+        for linha in problemas:
+            print("estagiário {}: {} gravado={!r} esperado={!r}".format(*linha))
+        print("Resumo consistente." if not problemas else f"{len(problemas)} divergências.")
+        sys.exit(1 if problemas else 0)
+    else:
+        sys.exit("uso: python resumo.py [reconstruir|verificar]")
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Banco PostgreSQL descartável para os testes marcados com @pytest.mark.postgres.
+# As tabelas são apagadas e recriadas a cada teste: nunca aponte para produção.
+#
+#     TEST_POSTGRES_URL=postgresql+psycopg2://postgres@localhost/teste pytest
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "postgres: precisa de TEST_POSTGRES_URL (pulado sem servidor)")
+
+
+@pytest.fixture
+def pg_engine():
+    from sqlalchemy import text
+    from banco import criar_engine
+    from models import Base
+
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL não definida")
+    engine = criar_engine(POSTGRES_URL)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception as e:
+        engine.dispose()
+        pytest.skip(f"PostgreSQL indisponível: {e}")
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
@@ -0,0 +1,81 @@
+import json
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from auditoria import GravadorAuditoria, RegistroAuditoria, desinstalar_auditoria, instalar_auditoria
+from banco import criar_engine
+from models import Base, Estagiario, Contrato, TermoCompromisso
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = criar_engine(f"sqlite:///{tmp_path / 'auditoria.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def Sessao(engine, tmp_path):
+    Sessao = sessionmaker(bind=engine)
+    gravador = GravadorAuditoria(engine, intervalo=0.05, arquivo_reserva=str(tmp_path / "reserva.jsonl"))
+    instalar_auditoria(Sessao, gravador, lambda: "teste")
+    yield Sessao
+    desinstalar_auditoria(Sessao)
+
+
+def _registros(Sessao, engine):
+    desinstalar_auditoria(Sessao)  # esvazia a fila no banco
+    with engine.connect() as conn:
+        return [
+            (r.tabela, r.operacao, json.loads(r.alteracoes))
+            for r in conn.execute(select(RegistroAuditoria).order_by(RegistroAuditoria.id_auditoria))
+        ]
+
+
+def test_update_de_atributo_expirado_guarda_o_valor_antigo(Sessao, engine):
+    with Sessao() as s:
+        est = Estagiario(nome="Ana", status="Ativo", lotacao="RH")
+        s.add(est)
+        s.commit()
+        # Sem leitura entre o commit e a alteração: lotacao está expirada
+        est.lotacao = "TI"
+        est.status = "Ativo"  # mesmo valor: não entra no log
+        s.commit()
+
+        s.delete(est)
+        s.commit()
+
+    registros = _registros(Sessao, engine)
+    assert [r[1] for r in registros] == ["insert", "update", "delete"]
+    assert registros[1][2] == {"lotacao": ["RH", "TI"]}
+    assert registros[2][2]["lotacao"][0] == "TI"
+
+
+def test_update_de_atributo_deferred(Sessao, engine):
+    with Sessao() as s:
+        est = Estagiario(nome="Ana", status="Ativo")
+        est.contratos.append(Contrato(data_inicio=date(2026, 1, 1), data_termino=date(2026, 6, 30)))
+        s.add(est)
+        s.flush()
+        termo = TermoCompromisso(id_contrato=est.contratos[0].id_contrato, nome_arquivo="t.pdf",
+                                 arquivo=b"%PDF-antigo")
+        s.add(termo)
+        s.commit()
+        termo.arquivo = b"%PDF"
+        s.commit()
+
+    update = [r for r in _registros(Sessao, engine) if r[:2] == ("termos_compromisso", "update")]
+    assert update[0][2] == {"arquivo": ["<11 bytes>", "<4 bytes>"]}
+
+
+def test_reinstalar_nao_duplica(Sessao, engine, tmp_path):
+    novo = GravadorAuditoria(engine, intervalo=0.05, arquivo_reserva=str(tmp_path / "reserva.jsonl"))
+    instalar_auditoria(Sessao, novo, lambda: "teste")
+    with Sessao() as s:
+        s.add(Estagiario(nome="Ana", status="Ativo"))
+        s.commit()
+    assert len(_registros(Sessao, engine)) == 1
@@ -0,0 +1,125 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import create_mock_engine
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from banco import criar_engine
+from busca import instalar_busca, buscar
+from models import Base, Estagiario, Contrato, Ferias
+
+
+# Os mesmos testes nos dois bancos: a busca tem de se comportar igual
+@pytest.fixture(params=["sqlite", pytest.param("postgresql", marks=pytest.mark.postgres)])
+def engine(request, tmp_path):
+    if request.param == "sqlite":
+        engine = criar_engine(f"sqlite:///{tmp_path / 'busca.db'}")
+        Base.metadata.create_all(bind=engine)
+    else:
+        engine = request.getfixturevalue("pg_engine")
+    # Um registro anterior à instalação: entra pela carga inicial, não pelo trigger
+    with Session(engine) as s:
+        s.add(Estagiario(nome="Ana Souza", curso="Direito", lotacao="RH", status="Ativo"))
+        s.commit()
+    assert instalar_busca(engine)
+    yield engine
+    engine.dispose()
+
+
+def _contrato(id_estagiario, **campos):
+    return Contrato(id_estagiario=id_estagiario, data_inicio=date(2026, 1, 1),
+                    data_termino=date(2026, 6, 30), status="Ativo", **campos)
+
+
+def test_carga_inicial_e_insert(engine):
+    with Session(engine) as s:
+        ana = s.query(Estagiario).one()
+        s.add(_contrato(ana.id_estagiario, substituindo="João Pereira", obs="licença médica"))
+        s.add(Ferias(id_estagiario=ana.id_estagiario, periodo_inicio=date(2026, 3, 2),
+                     periodo_fim=date(2026, 3, 11), memorando="Memorando 123/2026"))
+        s.commit()
+
+        resultados, total = buscar(s.connection(), "direito")
+        assert total == 1
+        assert resultados[0]["tipo"] == "estagiario"
+
+        # Sem acento e por prefixo
+        resultados, total = buscar(s.connection(), "joao")
+        assert total == 1
+        assert resultados[0]["tipo"] == "contrato"
+        assert resultados[0]["titulo"] == "Ana Souza"
+        assert "**João**" in resultados[0]["trecho"]
+
+        resultados, _ = buscar(s.connection(), "memo 123")
+        assert [r["tipo"] for r in resultados] == ["ferias"]
+
+
+def test_update_e_delete(engine):
+    with Session(engine) as s:
+        ana = s.query(Estagiario).one()
+        ct = _contrato(ana.id_estagiario, obs="substituição temporária")
+        s.add(ct)
+        s.commit()
+        assert buscar(s.connection(), "temporaria")[1] == 1
+
+        ct.obs = "prorrogação"
+        s.commit()
+        assert buscar(s.connection(), "temporaria")[1] == 0
+        assert buscar(s.connection(), "prorrogacao")[1] == 1
+
+        s.delete(ct)
+        s.commit()
+        assert buscar(s.connection(), "prorrogacao") == ([], 0)
+
+
+def test_ranking_e_paginacao(engine):
+    with Session(engine) as s:
+        ana = s.query(Estagiario).one()
+        s.add(_contrato(ana.id_estagiario, obs="reposição reposição reposição"))
+        for i in range(4):
+            s.add(_contrato(ana.id_estagiario, obs=f"reposição do setor {i} com observações extras"))
+        s.commit()
+
+        pagina1, total = buscar(s.connection(), "reposicao", pagina=1, por_pagina=2)
+        pagina2, _ = buscar(s.connection(), "reposicao", pagina=2, por_pagina=2)
+        pagina3, _ = buscar(s.connection(), "reposicao", pagina=3, por_pagina=2)
+
+        assert total == 5
+        assert [len(p) for p in (pagina1, pagina2, pagina3)] == [2, 2, 1]
+        # O contrato com o termo repetido e texto curto vem primeiro
+        assert "extras" not in pagina1[0]["trecho"]
+        ranks = [r["rank"] for r in pagina1 + pagina2 + pagina3]
+        assert ranks == sorted(ranks, reverse=True)
+        ids = {r["ref_id"] for r in pagina1 + pagina2 + pagina3}
+        assert len(ids) == 5
+
+
+def test_termo_vazio_ou_so_pontuacao(engine):
+    with Session(engine) as s:
+        assert buscar(s.connection(), "") == ([], 0)
+        assert buscar(s.connection(), '"*()') == ([], 0)
+        assert buscar(s.connection(), "!:* & |") == ([], 0)
+
+
+def test_trecho_longo_recortado_em_volta_do_termo(engine):
+    obs = " ".join(f"palavra{i}" for i in range(30)) + " gestação " + " ".join(f"fim{i}" for i in range(30))
+    with Session(engine) as s:
+        ana = s.query(Estagiario).one()
+        s.add(_contrato(ana.id_estagiario, obs=obs))
+        s.commit()
+
+        (resultado,), _ = buscar(s.connection(), "GESTACAO")
+        trecho = resultado["trecho"]
+        assert "**gestação**" in trecho
+        assert trecho.startswith("…") and trecho.endswith("…")
+        assert "palavra0 " not in trecho and "fim29" not in trecho
+
+
+def test_dialeto_sem_busca():
+    # Só o dialeto importa: nada é executado
+    engine = create_mock_engine("mysql://", executor=None)
+    assert instalar_busca(engine) is False
@@ -0,0 +1,77 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+import calendario
+from calendario import data_retorno, datas_retorno_lote, dias_uteis, dias_uteis_lote, proximo_dia_util
+
+
+def _limpar_caches():
+    calendario._feriados_por_lotacao.cache_clear()
+    calendario.calendario.cache_clear()
+
+
+@pytest.fixture
+def feriados(tmp_path, monkeypatch):
+    (tmp_path / "2026.csv").write_text(
+        "data,descricao,lotacao\n"
+        "2026-02-16,Carnaval,\n"
+        "2026-02-17,Carnaval,\n"
+        "2026-03-10,Aniversário da comarca,Comarca A\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(calendario, "PASTA_FERIADOS", str(tmp_path))
+    _limpar_caches()
+    yield
+    _limpar_caches()
+
+
+def test_dias_uteis_fim_de_semana_e_feriado(feriados):
+    assert dias_uteis(date(2026, 3, 2), date(2026, 3, 6)) == 5  # inclui as duas pontas
+    assert dias_uteis(date(2026, 3, 7), date(2026, 3, 8)) == 0  # sábado e domingo
+    assert dias_uteis(date(2026, 2, 16), date(2026, 2, 22)) == 3  # segunda e terça de Carnaval
+
+
+def test_data_retorno_e_proximo_dia_util(feriados):
+    # Férias até sexta antes do Carnaval: volta na quarta-feira de cinzas
+    assert data_retorno(date(2026, 2, 13)) == date(2026, 2, 18)
+    assert data_retorno(date(2026, 3, 4)) == date(2026, 3, 5)
+    assert proximo_dia_util(date(2026, 3, 7)) == date(2026, 3, 9)
+    assert proximo_dia_util(date(2026, 3, 9)) == date(2026, 3, 9)
+
+
+def test_feriado_so_da_lotacao(feriados):
+    semana = (date(2026, 3, 9), date(2026, 3, 13))
+    assert dias_uteis(*semana, lotacao="Comarca A") == 4
+    assert dias_uteis(*semana, lotacao=" Comarca A ") == 4
+    assert dias_uteis(*semana, lotacao="Comarca B") == 5
+    assert dias_uteis(*semana) == 5
+    assert data_retorno(date(2026, 3, 9), "Comarca A") == date(2026, 3, 11)
+    assert data_retorno(date(2026, 3, 9), "Comarca B") == date(2026, 3, 10)
+
+
+def test_lote_igual_ao_individual(feriados):
+    rnd = random.Random(0)
+    lotacoes = [None, "", "Comarca A", "Comarca B"]
+    inicios, fins, lots = [], [], []
+    for _ in range(300):
+        ini = date(2026, 1, 1) + timedelta(days=rnd.randrange(330))
+        inicios.append(ini)
+        fins.append(ini + timedelta(days=rnd.randrange(40)))
+        lots.append(rnd.choice(lotacoes))
+
+    assert list(dias_uteis_lote(inicios, fins, lots)) == [
+        dias_uteis(i, f, l or None) for i, f, l in zip(inicios, fins, lots)
+    ]
+    assert list(datas_retorno_lote(fins, lots).astype(object)) == [
+        data_retorno(f, l or None) for f, l in zip(fins, lots)
+    ]
+    # Sem lotações: calendário geral para todas as linhas
+    assert list(dias_uteis_lote(inicios, fins)) == [dias_uteis(i, f) for i, f in zip(inicios, fins)]
+
+
+def test_feriados_do_repositorio():
+    _limpar_caches()
+    assert dias_uteis(date(2026, 12, 21), date(2026, 12, 27)) == 4  # Natal numa sexta
+    assert data_retorno(date(2026, 4, 20)) == date(2026, 4, 22)  # Tiradentes
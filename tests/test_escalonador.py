@@ -0,0 +1,133 @@
+from collections import Counter
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from banco import criar_engine
+from calendario import calendario
+from escalonador import carregar_ferias_futuras, carregar_pendencias, escalonar
+from models import Base, Estagiario, Contrato, Ferias
+from resumo import instalar_resumo, verificar
+
+HOJE = date(2026, 3, 2)  # segunda-feira
+
+SessaoResumo = sessionmaker()
+instalar_resumo(SessaoResumo)
+
+
+def _p(id_estagiario, lotacao, dias_ate_termino, saldo, inicio=None):
+    return {"id_estagiario": id_estagiario, "nome": f"E{id_estagiario}", "lotacao": lotacao,
+            "inicio": inicio, "termino": HOJE + timedelta(days=dias_ate_termino), "saldo": saldo}
+
+
+def _dias(inicio, fim):
+    return [inicio + timedelta(days=i) for i in range((fim - inicio).days + 1)]
+
+
+def test_limite_por_lotacao_nunca_e_excedido():
+    pendencias = [_p(i, "RH", 120, 15) for i in range(12)] + [_p(100 + i, "TI", 120, 15) for i in range(5)]
+    # Férias já registradas de outro estagiário do RH ocupam a primeira semana
+    existentes = [(999, "RH", HOJE, HOJE + timedelta(days=6))]
+
+    propostas, sem_janela = escalonar(pendencias, existentes, limites={"RH": 2}, limite_padrao=1, hoje=HOJE)
+
+    assert len(propostas) + len(sem_janela) == len(pendencias)
+    ocupacao = Counter()
+    for _, lotacao, ini, fim in existentes:
+        ocupacao.update((lotacao, d) for d in _dias(ini, fim))
+    for p in propostas:
+        ocupacao.update((p["lotacao"], d) for d in _dias(p["periodo_inicio"], p["periodo_fim"]))
+    assert max(n for (l, _), n in ocupacao.items() if l == "RH") == 2
+    assert max(n for (l, _), n in ocupacao.items() if l == "TI") <= 1
+
+
+def test_respeita_ferias_existentes_contrato_e_dia_util():
+    inicio = HOJE + timedelta(days=3)
+    pendencias = [_p(1, "RH", 90, 20, inicio=inicio), _p(2, "RH", 25, 15)]
+    existentes = [(1, "RH", inicio, inicio + timedelta(days=29))]
+
+    propostas, sem_janela = escalonar(pendencias, existentes, limite_padrao=5, hoje=HOJE)
+
+    assert not sem_janela
+    por_id = {p["id_estagiario"]: p for p in propostas}
+    p1 = por_id[1]
+    # Não cruza as férias já registradas nem começa antes do contrato
+    assert p1["periodo_inicio"] > inicio + timedelta(days=29)
+    for p in propostas:
+        assert p["periodo_fim"] <= p["termino"]
+        assert (p["periodo_fim"] - p["periodo_inicio"]).days + 1 == p["saldo"] == p["dias"]
+        assert np.is_busday(np.datetime64(p["periodo_inicio"], "D"), busdaycal=calendario(p["lotacao"]))
+
+
+def test_sem_janela():
+    pendencias = [
+        _p(1, "RH", 10, 30),  # saldo maior que o tempo até o fim do contrato
+        _p(2, "TI", 40, 10),  # lotação lotada até depois do término
+    ]
+    existentes = [(999, "TI", HOJE, HOJE + timedelta(days=60))]
+
+    propostas, sem_janela = escalonar(pendencias, existentes, limite_padrao=1, hoje=HOJE)
+
+    assert propostas == []
+    assert sorted(p["id_estagiario"] for p in sem_janela) == [1, 2]
+
+
+def test_ordem_do_heap():
+    pendencias = [
+        _p(1, "RH", 200, 20),  # término mais distante: por último
+        _p(2, "RH", 60, 10),   # término mais próximo: primeiro
+        _p(3, "RH", 150, 5),   # mesmo término que o 4, saldo menor
+        _p(4, "RH", 150, 10),
+    ]
+
+    propostas, _ = escalonar(pendencias, limite_padrao=1, hoje=HOJE)
+
+    assert [p["id_estagiario"] for p in propostas] == [2, 4, 3, 1]
+    assert propostas[0]["periodo_inicio"] == HOJE
+    inicios = [p["periodo_inicio"] for p in propostas]
+    assert inicios == sorted(inicios)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = criar_engine(f"sqlite:///{tmp_path / 'escala.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def test_registro_em_lote_atualiza_o_resumo(engine):
+    with SessaoResumo(bind=engine) as s:
+        for i in range(6):
+            est = Estagiario(nome=f"E{i}", status="Ativo", lotacao="RH" if i % 2 else "TI")
+            est.contratos.append(Contrato(data_inicio=HOJE - timedelta(days=200),
+                                          data_termino=HOJE + timedelta(days=100), status="Ativo"))
+            s.add(est)
+        # Saldo já usufruído: não deve aparecer
+        usou = Estagiario(nome="Usou", status="Ativo", lotacao="RH")
+        usou.contratos.append(Contrato(data_inicio=HOJE - timedelta(days=200),
+                                       data_termino=HOJE + timedelta(days=100), status="Ativo"))
+        usou.ferias.append(Ferias(periodo_inicio=HOJE - timedelta(days=60),
+                                  periodo_fim=HOJE - timedelta(days=35), dias_usufruidos="25"))
+        s.add(usou)
+        s.commit()
+
+        pendencias = carregar_pendencias(s.connection(), HOJE)
+        assert len(pendencias) == 6 and usou.id_estagiario not in {p["id_estagiario"] for p in pendencias}
+
+        propostas, sem_janela = escalonar(pendencias, carregar_ferias_futuras(s.connection(), HOJE),
+                                          limite_padrao=3, hoje=HOJE)
+        assert not sem_janela
+        # Como a página: um add_all e um commit para todas as propostas
+        s.add_all([
+            Ferias(id_estagiario=p["id_estagiario"], periodo_inicio=p["periodo_inicio"],
+                   periodo_fim=p["periodo_fim"], dias_usufruidos=str(p["saldo"]),
+                   memorando="Escala automática")
+            for p in propostas
+        ])
+        s.commit()
+
+        assert carregar_pendencias(s.connection(), HOJE) == []
+    assert verificar(engine) == []
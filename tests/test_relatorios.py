@@ -0,0 +1,109 @@
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from relatorios import COLUNAS_CONTRATOS, METRICAS, CacheSerieMensal, serie_mensal
+
+
+def _contratos(linhas):
+    df = pd.DataFrame(linhas, columns=COLUNAS_CONTRATOS)
+    return df.astype({"data_inicio": "datetime64[ns]", "data_termino": "datetime64[ns]"})
+
+
+def _mes(texto):
+    return pd.Period(texto, freq="M")
+
+
+def _por_mes(serie):
+    return serie.set_index(serie["mes"].astype(str))[METRICAS].to_dict("index")
+
+
+def test_headcount_sem_duplicar_contratos_sobrepostos():
+    contratos = _contratos([
+        (1, 1, date(2026, 1, 10), date(2026, 6, 30), "inicial", "RH", "Direito"),
+        # Renovação que começa antes do fim do anterior: mesmo estagiário
+        (2, 1, date(2026, 4, 1), date(2026, 9, 30), "renovacao", "RH", "Direito"),
+        (3, 2, date(2026, 2, 1), date(2026, 3, 31), "inicial", "TI", None),
+    ])
+    serie = _por_mes(serie_mensal(contratos, _mes("2026-01"), _mes("2026-10"), hoje=date(2026, 12, 1)))
+
+    assert [serie[m]["ativos"] for m in serie] == [1, 2, 2, 1, 1, 1, 1, 1, 1, 0]
+    assert serie["2026-01"]["contratacoes"] == 1 and serie["2026-02"]["contratacoes"] == 1
+    assert serie["2026-04"] == {"ativos": 1, "contratacoes": 0, "renovacoes": 1, "desligamentos": 0}
+    # Desligamento só no último término de cada estagiário
+    assert serie["2026-03"]["desligamentos"] == 1
+    assert serie["2026-06"]["desligamentos"] == 0
+    assert serie["2026-09"]["desligamentos"] == 1
+
+
+def test_desligamento_futuro_nao_conta_e_agrupamento():
+    contratos = _contratos([
+        (1, 1, date(2026, 1, 1), date(2026, 2, 28), "inicial", "RH", "Direito"),
+        (2, 2, date(2026, 1, 1), date(2026, 5, 31), "inicial", None, "Direito"),
+    ])
+    serie = serie_mensal(contratos, _mes("2026-01"), _mes("2026-05"), por="lotacao", hoje=date(2026, 3, 15))
+
+    assert set(serie["lotacao"]) == {"RH", "Não informado"}
+    assert len(serie) == 10  # todo mês para toda lotação, mesmo zerado
+    deslig = serie[serie["desligamentos"] > 0]
+    assert list(zip(deslig["mes"].astype(str), deslig["lotacao"])) == [("2026-02", "RH")]
+
+
+def _referencia(contratos, meses, hoje):
+    # Cálculo direto, linha a linha, para comparar com o vetorizado
+    ultimo = contratos.sort_values("data_termino").drop_duplicates("id_estagiario", keep="last")
+    saida = {}
+    for mes in meses:
+        ini, fim = mes.start_time, mes.end_time
+        cobre = contratos[(contratos["data_inicio"] <= fim) & (contratos["data_termino"] >= ini)]
+        comecam = contratos[(contratos["data_inicio"] >= ini) & (contratos["data_inicio"] <= fim)]
+        saem = ultimo[(ultimo["data_termino"] >= ini) & (ultimo["data_termino"] <= fim)
+                      & (ultimo["data_termino"] < pd.Timestamp(hoje))]
+        saida[str(mes)] = {
+            "ativos": cobre["id_estagiario"].nunique(),
+            "contratacoes": int((comecam["tipo_contrato"] != "renovacao").sum()),
+            "renovacoes": int((comecam["tipo_contrato"] == "renovacao").sum()),
+            "desligamentos": len(saem),
+        }
+    return saida
+
+
+def _aleatorios(n=400, semente=1):
+    rnd = random.Random(semente)
+    linhas = []
+    for i in range(n):
+        ini = date(2024, 1, 1) + timedelta(days=rnd.randrange(900))
+        fim = ini + timedelta(days=rnd.randrange(30, 400))
+        linhas.append((i, rnd.randrange(120), ini, fim, rnd.choice(["inicial", "renovacao", None]),
+                       rnd.choice(["RH", "TI", None]), "Direito"))
+    return _contratos(linhas)
+
+
+def test_vetorizado_igual_ao_calculo_direto():
+    contratos = _aleatorios()
+    hoje = date(2025, 8, 15)
+    meses = pd.period_range("2024-01", "2026-12", freq="M")
+    serie = serie_mensal(contratos, meses[0], meses[-1], hoje=hoje)
+    assert _por_mes(serie) == _referencia(contratos, meses, hoje)
+
+
+@pytest.mark.parametrize("por", [None, "lotacao"])
+def test_virada_de_mes_igual_a_recalculo(por):
+    contratos = _aleatorios(semente=2)
+    carregamentos = []
+
+    def carregar(desde):
+        carregamentos.append(desde)
+        return contratos if desde is None else contratos[contratos["data_termino"] >= pd.Timestamp(desde)]
+
+    cache = CacheSerieMensal()
+    cache.obter(carregar, versao=(1,), por=por, hoje=date(2025, 3, 10))
+    carregamentos.clear()
+    # Mesma versão, três meses depois: só os meses novos são calculados
+    incremental = cache.obter(carregar, versao=(1,), por=por, hoje=date(2025, 6, 20))
+    assert None not in carregamentos
+
+    completo = CacheSerieMensal().obter(carregar, versao=(1,), por=por, hoje=date(2025, 6, 20))
+    pd.testing.assert_frame_equal(incremental, completo)
@@ -0,0 +1,115 @@
+import threading
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from banco import criar_engine
+from models import Base, Estagiario, Contrato, Ferias, EstagiarioResumo
+from resumo import instalar_resumo, verificar
+
+# Eventos só nesta fábrica: não vazam para a Session global dos outros testes
+SessaoResumo = sessionmaker()
+instalar_resumo(SessaoResumo)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = criar_engine(f"sqlite:///{tmp_path / 'resumo.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _estagiario(engine, nome="Ana"):
+    with SessaoResumo(bind=engine) as s:
+        est = Estagiario(nome=nome, status="Ativo")
+        s.add(est)
+        s.commit()
+        return est.id_estagiario
+
+
+def _contrato(id_estagiario, mes, status="Ativo"):
+    return Contrato(id_estagiario=id_estagiario, data_inicio=date(2026, mes, 1),
+                    data_termino=date(2026, mes, 28), status=status)
+
+
+def test_insert_update_e_delete(engine):
+    ide = _estagiario(engine)
+    with SessaoResumo(bind=engine) as s:
+        s.add(_contrato(ide, 1, status="Encerrado"))
+        s.add(_contrato(ide, 2))
+        s.add(Ferias(id_estagiario=ide, periodo_inicio=date(2026, 2, 2),
+                     periodo_fim=date(2026, 2, 6), dias_usufruidos="5 dias"))
+        s.commit()
+
+        r = s.get(EstagiarioResumo, ide)
+        assert (r.total_contratos, r.contratos_encerrados, r.dias_usufruidos) == (2, 1, 5.0)
+        assert r.inicio_contrato_atual == date(2026, 2, 1)
+
+        # Segunda gravação do mesmo estagiário: atualiza a linha existente
+        s.add(_contrato(ide, 3))
+        s.commit()
+        s.expire_all()
+        assert s.get(EstagiarioResumo, ide).total_contratos == 3
+
+        s.delete(s.get(Estagiario, ide))
+        s.commit()
+        assert s.get(EstagiarioResumo, ide) is None
+    assert verificar(engine) == []
+
+
+@pytest.mark.parametrize("como", ["id", "relacao"])
+def test_troca_de_estagiario_depois_do_commit(engine, como):
+    ana, bia = _estagiario(engine, "Ana"), _estagiario(engine, "Bia")
+    with SessaoResumo(bind=engine) as s:
+        ct = _contrato(ana, 1)
+        ferias = Ferias(id_estagiario=ana, periodo_inicio=date(2026, 1, 5),
+                        periodo_fim=date(2026, 1, 9), dias_usufruidos="5")
+        s.add_all([ct, ferias])
+        s.commit()
+
+        # Após o commit tudo está expirado: a troca é feita sem ler o valor antigo
+        if como == "id":
+            ct.id_estagiario = bia
+            ferias.id_estagiario = bia
+        else:
+            ct.estagiario = s.get(Estagiario, bia)
+            ferias.estagiario = s.get(Estagiario, bia)
+        s.commit()
+
+        s.expire_all()
+        origem, destino = s.get(EstagiarioResumo, ana), s.get(EstagiarioResumo, bia)
+        assert (origem.total_contratos, origem.dias_usufruidos) == (0, 0.0)
+        assert (destino.total_contratos, destino.dias_usufruidos) == (1, 5.0)
+    assert verificar(engine) == []
+
+
+@pytest.mark.postgres
+def test_gravacoes_simultaneas_do_mesmo_estagiario(pg_engine):
+    ide = _estagiario(pg_engine)
+    barreira = threading.Barrier(2)
+    erros = []
+
+    def salvar(mes):
+        try:
+            with SessaoResumo(bind=pg_engine) as s:
+                s.add(_contrato(ide, mes))
+                barreira.wait()
+                s.flush()
+                time.sleep(0.3)  # segura o lock enquanto a outra tenta gravar
+                s.commit()
+        except Exception as e:
+            erros.append(e)
+
+    threads = [threading.Thread(target=salvar, args=(mes,)) for mes in (1, 2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert erros == []
+    with Session(pg_engine) as s:
+        assert s.get(EstagiarioResumo, ide).total_contratos == 2
+    assert verificar(pg_engine) == []
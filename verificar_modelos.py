@@ -0,0 +1,111 @@
+"""Confere os models nos dois bancos suportados (PostgreSQL e SQLite).
+
+Gera o DDL nos dois dialetos e faz um ciclo completo (criar tabelas,
+inserir, ler o termo sob demanda, apagar em cascata, conferir o resumo) num
+SQLite temporário.
+
+Com --banco-real o ciclo roda também no banco de DATABASE_URL (se não for
+SQLite), numa única transação desfeita no fim: cada commit do ciclo vira um
+savepoint e nada fica gravado.
+
+    python verificar_modelos.py [--banco-real]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from banco import criar_engine
+from models import Base, Estagiario, Contrato, Ferias, TermoCompromisso, EstagiarioResumo
+from resumo import instalar_resumo, divergencias
+
+
+def ddl(dialeto):
+    for tabela in Base.metadata.sorted_tables:
+        CreateTable(tabela).compile(dialect=dialeto)
+
+
+def ciclo(url, descartar=False):
+    t0 = time.perf_counter()
+    engine = criar_engine(url)
+    with engine.connect() as conn:
+        transacao = conn.begin()
+        Base.metadata.create_all(bind=conn)
+        if not descartar:
+            transacao.commit()
+        pronto = time.perf_counter() - t0
+
+        # descartar: as sessões trabalham em savepoints dentro de `transacao`
+        opcoes = {"join_transaction_mode": "create_savepoint"} if descartar else {}
+
+        with Session(bind=conn, **opcoes) as s:
+            est = Estagiario(nome="Verificação de Models", status="Ativo")
+            ct = Contrato(data_inicio=date.today(), data_termino=date.today() + timedelta(days=179),
+                          status="Ativo", tipo_contrato="inicial")
+            est.contratos.append(ct)
+            est.ferias.append(Ferias(periodo_inicio=date.today(), periodo_fim=date.today(),
+                                     dias_usufruidos="1"))
+            s.add(est)
+            s.flush()
+            s.add(TermoCompromisso(id_contrato=ct.id_contrato, nome_arquivo="termo.pdf",
+                                   mime_type="application/pdf", tamanho_arquivo=4,
+                                   arquivo=b"%PDF"))
+            s.commit()
+            id_est, id_ct = est.id_estagiario, ct.id_contrato
+
+        with Session(bind=conn, **opcoes) as s:
+            termo = s.query(TermoCompromisso).filter(TermoCompromisso.id_contrato == id_ct).one()
+            assert "arquivo" not in termo.__dict__, "arquivo deveria ser carregado sob demanda"
+            assert termo.arquivo == b"%PDF"
+            assert s.get(EstagiarioResumo, id_est).total_contratos == 1
+            assert not [d for d in divergencias(s.connection()) if d[0] == id_est]
+
+            s.delete(s.get(Estagiario, id_est))
+            s.commit()
+            # Termo apagado pelo ondelete="CASCADE" do banco (no SQLite exige foreign_keys=ON)
+            assert s.query(TermoCompromisso).filter(TermoCompromisso.id_contrato == id_ct).count() == 0
+            assert s.get(EstagiarioResumo, id_est) is None
+
+        if descartar:
+            transacao.rollback()
+
+    engine.dispose()
+    return pronto
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--banco-real", action="store_true",
+                        help="roda o ciclo também em DATABASE_URL, numa transação desfeita no fim")
+    args = parser.parse_args()
+
+    urls = [(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'verificacao.db')}", False)]
+    banco_real = os.getenv("DATABASE_URL")
+    if args.banco_real:
+        if not banco_real or banco_real.startswith("sqlite"):
+            parser.error("--banco-real exige DATABASE_URL apontando para um banco que não seja SQLite")
+        urls.append((banco_real, True))
+
+    instalar_resumo(Session)
+
+    ddl(postgresql.dialect())
+    ddl(sqlite.dialect())
+    print("DDL: ok em postgresql e sqlite")
+
+    for url, descartar in urls:
+        nome = url.split(":", 1)[0]
+        try:
+            pronto = ciclo(url, descartar)
+        except AssertionError as e:
+            sys.exit(f"{nome}: FALHOU - {e}")
+        print(f"{nome}: ok (engine + tabelas em {pronto * 1e3:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
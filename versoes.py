@@ -0,0 +1,49 @@
+import threading
+
+from sqlalchemy import event, inspect
+
+# Contador de versão por tabela, compartilhado por todas as sessões do processo.
+# Serve de chave para os caches de consulta: mudou a tabela, muda a chave.
+_versoes = {}
+_lock = threading.Lock()
+
+
+def versao(*tabelas):
+    with _lock:
+        return tuple(_versoes.get(t, 0) for t in tabelas)
+
+
+def incrementar(*tabelas):
+    with _lock:
+        for t in tabelas:
+            _versoes[t] = _versoes.get(t, 0) + 1
+
+
+def _anotar(session, flush_context):
+    tabelas = session.info.setdefault("tabelas_alteradas", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        tabelas.add(inspect(obj).mapper.local_table.name)
+
+
+def _publicar(session):
+    tabelas = session.info.pop("tabelas_alteradas", None)
+    if tabelas:
+        incrementar(*tabelas)
+
+
+def _descartar(session):
+    session.info.pop("tabelas_alteradas", None)
+
+
+_OUVINTES = (("after_flush", _anotar), ("after_commit", _publicar), ("after_rollback", _descartar))
+
+
+def instalar_versionamento(alvo):
+    """Incrementa a versão das tabelas tocadas por uma sessão quando ela faz commit.
+
+    Idempotente: reinstalar no mesmo alvo (ex.: "Clear cache" do Streamlit) não
+    duplica os ouvintes.
+    """
+    for nome, fn in _OUVINTES:
+        if not event.contains(alvo, nome, fn):
+            event.listen(alvo, nome, fn)